@@ -22,6 +22,12 @@ class AnkiClient:
         """
         self.url = url
         self.version = 6
+        # Reuse one connection pool (HTTP keep-alive) across invocations
+        self._session = requests.Session()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self._session.close()
 
     def _invoke(self, action: str, params: dict[str, Any] | None = None) -> Any:
         """Invoke an AnkiConnect action.
@@ -45,7 +51,7 @@ class AnkiClient:
             payload["params"] = params
 
         try:
-            response = requests.post(self.url, json=payload, timeout=10)
+            response = self._session.post(self.url, json=payload, timeout=10)
             response.raise_for_status()
         except requests.RequestException as e:
             raise AnkiConnectError(
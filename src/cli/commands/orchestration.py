@@ -1,6 +1,8 @@
 """Orchestration commands: serve, up, down, status, logs, flow."""
 
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import click
 
@@ -55,6 +57,36 @@ def serve(port: int, host: str, reload: bool):
     )
 
 
+def _wait_for_stack(logs_command: str) -> None:
+    """Wait for backend and frontend in parallel, exiting if either fails."""
+    probes = [
+        ("Backend", BACKEND_URL, f"{BACKEND_URL}/api/health", 30),
+        ("Frontend", FRONTEND_URL, FRONTEND_URL, 60),
+    ]
+
+    print_info("Waiting for backend and frontend...")
+    # Set on the first failure so the other probe stops polling right away
+    stop = threading.Event()
+    failed: str | None = None
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        futures = {}
+        for name, url, probe_url, timeout in probes:
+            future = pool.submit(wait_for_server, probe_url, timeout=timeout, stop=stop)
+            futures[future] = (name, url)
+        for future in as_completed(futures):
+            name, url = futures[future]
+            if not future.result():
+                failed = name
+                stop.set()
+                break
+            print_success(f"{name} running at {url}")
+
+    if failed is not None:
+        print_error(f"{failed} server failed to start")
+        print_info(f"Check logs with: {logs_command}")
+        sys.exit(1)
+
+
 # ── Stack lifecycle: up / down / status / logs ──────────────────────────
 
 
@@ -90,19 +122,7 @@ def up(no_browser: bool):
         sys.exit(1)
 
     # Step 3: Wait for servers to be ready
-    print_info("Waiting for backend...")
-    if not wait_for_server(f"{BACKEND_URL}/api/health", timeout=30):
-        print_error("Backend server failed to start")
-        print_info("Check logs with: anki-api logs")
-        sys.exit(1)
-    print_success(f"Backend running at {BACKEND_URL}")
-
-    print_info("Waiting for frontend...")
-    if not wait_for_server(FRONTEND_URL, timeout=60):
-        print_error("Frontend server failed to start")
-        print_info("Check logs with: anki-api logs")
-        sys.exit(1)
-    print_success(f"Frontend running at {FRONTEND_URL}")
+    _wait_for_stack("anki-api logs")
 
     # Step 4: Open browser (Chrome preferred)
     if not no_browser:
@@ -230,19 +250,7 @@ def flow(
         sys.exit(1)
 
     # Step 4: Wait for servers to be ready
-    print_info("Waiting for backend...")
-    if not wait_for_server(f"{BACKEND_URL}/api/health", timeout=30):
-        print_error("Backend server failed to start")
-        print_info("Check logs with: anki-api flow logs")
-        sys.exit(1)
-    print_success(f"Backend running at {BACKEND_URL}")
-
-    print_info("Waiting for frontend...")
-    if not wait_for_server(FRONTEND_URL, timeout=60):
-        print_error("Frontend server failed to start")
-        print_info("Check logs with: anki-api flow logs")
-        sys.exit(1)
-    print_success(f"Frontend running at {FRONTEND_URL}")
+    _wait_for_stack("anki-api flow logs")
 
     # Step 5: Open browser
     if not no_browser:
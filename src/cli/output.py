@@ -35,36 +35,30 @@ def print_card(
         index: Optional card index (1-based)
         total: Optional total number of cards
     """
+    parts = [f"\n{'=' * 60}\n"]
     if index and total:
-        click.echo(f"\n{'=' * 60}")
-        click.secho(f"[{index}/{total}]", fg="cyan", bold=True)
-    else:
-        click.echo(f"\n{'=' * 60}")
-
-    click.echo()
-    click.secho("Front:", fg="yellow", bold=True)
-    click.echo(f"  {card.front}")
-    click.echo()
-    click.secho("Back:", fg="yellow", bold=True)
-    click.echo(f"  {card.back}")
-
-    if card.context:
-        click.echo()
-        click.secho("Context:", fg="yellow", bold=True)
-        click.echo(f"  {card.context}")
-
-    if card.tags:
-        click.echo()
-        click.secho("Tags:", fg="yellow", bold=True)
-        click.echo(f"  {', '.join(card.tags)}")
-
-    if card.source:
-        click.echo()
-        click.secho("Source:", fg="yellow", bold=True)
-        click.echo(f"  {card.source}")
-
-    click.echo()
-    click.secho(f"Deck: {card.deck} | Model: {card.model}", fg="cyan")
+        parts.append(click.style(f"[{index}/{total}]", fg="cyan", bold=True) + "\n")
+
+    sections = [
+        ("Front", card.front),
+        ("Back", card.back),
+        ("Context", card.context),
+        ("Tags", ", ".join(card.tags)),
+        ("Source", card.source),
+    ]
+    for label, value in sections:
+        # Front and back are always shown, even when empty
+        if value or label in ("Front", "Back"):
+            parts.append(
+                f"\n{click.style(f'{label}:', fg='yellow', bold=True)}\n  {value}\n"
+            )
+
+    parts.append(
+        "\n" + click.style(f"Deck: {card.deck} | Model: {card.model}", fg="cyan")
+    )
+
+    # Single write per card instead of one per line
+    click.echo("".join(parts))
 
 
 def print_validation_warnings(warnings: list[ValidationWarning]) -> None:
@@ -2,10 +2,11 @@
 
 import shutil
 import subprocess
+import threading
 import time
+from http.client import HTTPConnection, HTTPException
 from pathlib import Path
-
-import requests
+from urllib.parse import urlsplit
 
 PROJECT_DIR = Path(__file__).parent.parent.parent
 FRONTEND_DIR = PROJECT_DIR / "web" / "frontend"
@@ -24,17 +25,31 @@ def run_claude_generation(source: str, tags: str | None) -> bool:
     return result.returncode == 0
 
 
-def wait_for_server(url: str, timeout: int = 30) -> bool:
-    """Poll URL until it responds or timeout."""
+def wait_for_server(
+    url: str, timeout: int = 30, stop: threading.Event | None = None
+) -> bool:
+    """Poll URL until it responds, timeout elapses, or stop is set."""
+    parts = urlsplit(url)
+    host = parts.hostname or "localhost"
+    path = parts.path or "/"
+    if parts.query:
+        path += f"?{parts.query}"
+
     start = time.time()
     while time.time() - start < timeout:
+        conn = HTTPConnection(host, parts.port, timeout=2)
         try:
-            resp = requests.get(url, timeout=2)
-            if resp.status_code == 200:
+            conn.request("GET", path, headers={"User-Agent": "anki-api-cli"})
+            if conn.getresponse().status == 200:
                 return True
-        except requests.RequestException:
+        except (OSError, HTTPException):
             pass
-        time.sleep(1)
+        finally:
+            conn.close()
+        if stop is None:
+            time.sleep(1)
+        elif stop.wait(1):
+            return False
     return False
 
 
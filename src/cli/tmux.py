@@ -1,7 +1,9 @@
 """Tmux session management for CLI."""
 
+import os
 import subprocess
 from pathlib import Path
+from typing import NoReturn
 
 TMUX_SESSION = "anki-flow"
 PROJECT_DIR = Path(__file__).parent.parent.parent
@@ -26,9 +28,12 @@ def tmux_kill_session() -> bool:
     return result.returncode == 0
 
 
-def tmux_attach_session() -> None:
-    """Attach to the anki-flow tmux session."""
-    subprocess.run(["tmux", "attach", "-t", TMUX_SESSION])
+def tmux_attach_session() -> NoReturn:
+    """Attach to the anki-flow tmux session.
+
+    Replaces the current process with tmux; this call does not return.
+    """
+    os.execvp("tmux", ["tmux", "attach", "-t", TMUX_SESSION])
 
 
 def tmux_create_session() -> bool:
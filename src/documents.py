@@ -3,9 +3,10 @@
 import re
 from collections.abc import Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from docx import Document
-from docx.table import Table
+if TYPE_CHECKING:
+    from docx.table import Table
 
 PathLike = str | Path
 
@@ -14,11 +15,16 @@ __all__ = ["export_docx_to_markdown", "extract_docx_text"]
 
 def extract_docx_text(docx_path: PathLike) -> str:
     """Return a markdown-friendly string extracted from a DOCX file."""
+    # Deferred so CLI startup doesn't pay for python-docx/lxml
+    from docx import Document
+    from docx.opc.exceptions import PackageNotFoundError
+
     path = Path(docx_path)
-    if not path.exists():
-        raise ValueError(f"DOCX file not found: {path}")
+    try:
+        document = Document(str(path))
+    except (FileNotFoundError, PackageNotFoundError) as e:
+        raise ValueError(f"DOCX file not found or unreadable: {path}") from e
 
-    document = Document(str(path))
     lines: list[str] = []
 
     for paragraph in document.paragraphs:
@@ -69,7 +75,7 @@ def _heading_level(style_name: str) -> int:
     return 2
 
 
-def _table_to_markdown(table: Table) -> Sequence[str]:
+def _table_to_markdown(table: "Table") -> Sequence[str]:
     rows: list[str] = []
     for row in table.rows:
         cells = [" ".join(cell.text.split()) for cell in row.cells]
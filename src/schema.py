@@ -1,9 +1,24 @@
 """Flashcard schema and validation based on EAT principles."""
 
-import json
-from dataclasses import asdict, dataclass, field
+import re
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import ClassVar
+
+import orjson
+
+# Matches CRLF, lone CR, or LF so all line endings convert in one pass
+_NEWLINE_RE = re.compile(r"\r\n?|\n")
+
+# Card fields whose values repeat across cards and are worth interning
+_INTERNED_FIELDS = ("deck", "model", "source", "status")
+
+
+def _intern(value: object) -> object:
+    """Intern strings, passing any other value through unchanged."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 def convert_newlines_to_html(text: str) -> str:
@@ -18,11 +33,10 @@ def convert_newlines_to_html(text: str) -> str:
     Returns:
         Text with <br> tags for HTML rendering
     """
-    normalized = text.replace("\r\n", "\n").replace("\r", "\n")
-    return normalized.replace("\n", "<br>")
+    return _NEWLINE_RE.sub("<br>", text)
 
 
-@dataclass
+@dataclass(slots=True)
 class Flashcard:
     """Represents a single flashcard with EAT principles validation.
 
@@ -70,28 +84,62 @@ class Flashcard:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        # Explicit literal avoids asdict()'s recursive deepcopy of every field
+        return {
+            "front": self.front,
+            "back": self.back,
+            "context": self.context,
+            "tags": self.tags[:] if isinstance(self.tags, list) else self.tags,
+            "source": self.source,
+            "deck": self.deck,
+            "model": self.model,
+            "anki_id": self.anki_id,
+            "status": self.status,
+            "added_at": (
+                self.added_at.isoformat()
+                if isinstance(self.added_at, datetime)
+                else self.added_at
+            ),
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Flashcard":
         """Create Flashcard from dictionary."""
+        fields = dict(data)
+
+        # Intern low-cardinality strings so cards loaded from the same file share
+        # one copy of each tag/deck/model/source/status value
+        tags = fields.get("tags")
+        if isinstance(tags, list):
+            fields["tags"] = [_intern(tag) for tag in tags]
+        for key in _INTERNED_FIELDS:
+            if key in fields:
+                fields[key] = _intern(fields[key])
+
         # Parse datetime string if present
-        if "added_at" in data and isinstance(data["added_at"], str):
-            data = data.copy()
-            data["added_at"] = datetime.fromisoformat(data["added_at"])
-        return cls(**data)
+        added_at = fields.get("added_at")
+        if isinstance(added_at, str):
+            fields["added_at"] = datetime.fromisoformat(added_at)
+        return cls(**fields)
 
 
 class ValidationWarning:
     """Represents a validation warning with severity level."""
 
+    _ICONS: ClassVar[dict[str, str]] = {"info": "ℹ️", "warning": "⚠️", "error": "❌"}
+
     def __init__(self, message: str, severity: str = "warning"):
         self.message = message
         self.severity = severity  # 'info', 'warning', 'error'
 
     def __str__(self):
-        icon = {"info": "ℹ️", "warning": "⚠️", "error": "❌"}.get(self.severity, "•")
-        return f"{icon} {self.message}"
+        return f"{self._ICONS.get(self.severity, '•')} {self.message}"
+
+
+# Structural errors are the same for every card, so each is allocated once and
+# shared (warnings are never mutated after construction)
+_EMPTY_FRONT = ValidationWarning("Front cannot be empty.", "error")
+_EMPTY_BACK = ValidationWarning("Back cannot be empty.", "error")
 
 
 def validate_card(card: Flashcard) -> list[ValidationWarning]:
@@ -117,14 +165,26 @@ def validate_card(card: Flashcard) -> list[ValidationWarning]:
     warnings = []
 
     if not card.front.strip():
-        warnings.append(ValidationWarning("Front cannot be empty.", "error"))
+        warnings.append(_EMPTY_FRONT)
 
     if not card.back.strip():
-        warnings.append(ValidationWarning("Back cannot be empty.", "error"))
+        warnings.append(_EMPTY_BACK)
 
     return warnings
 
 
+def validate_cards(cards: list[Flashcard]) -> list[list[ValidationWarning]]:
+    """Validate a list of cards in one pass.
+
+    Args:
+        cards: Flashcards to validate
+
+    Returns:
+        Validation warnings for each card, in the same order as ``cards``
+    """
+    return [validate_card(card) for card in cards]
+
+
 def load_cards_from_json(file_path: str) -> list[Flashcard]:
     """Load flashcards from a JSON file.
 
@@ -138,8 +198,7 @@ def load_cards_from_json(file_path: str) -> list[Flashcard]:
         ValueError: If JSON is invalid or cards are malformed
     """
     try:
-        with Path(file_path).open(encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(Path(file_path).read_bytes())
 
         # Handle both single card and array of cards
         if isinstance(data, dict):
@@ -148,7 +207,7 @@ def load_cards_from_json(file_path: str) -> list[Flashcard]:
         cards = [Flashcard.from_dict(card_data) for card_data in data]
         return cards
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in {file_path}: {e}") from e
     except Exception as e:
         raise ValueError(f"Error loading cards from {file_path}: {e}") from e
@@ -161,14 +220,9 @@ def save_cards_to_json(cards: list[Flashcard], file_path: str) -> None:
         cards: List of Flashcard objects
         file_path: Path to output JSON file
     """
-
-    def datetime_serializer(obj):
-        """Custom JSON serializer for datetime objects."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
     data = [card.to_dict() for card in cards]
 
-    with Path(file_path).open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=datetime_serializer)
+    # orjson writes UTF-8 bytes directly, skipping the intermediate str
+    Path(file_path).write_bytes(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    )
@@ -1,16 +1,16 @@
 """YouTube transcript extraction utilities."""
 
 import re
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import (
-    NoTranscriptFound,
-    TranscriptsDisabled,
-    VideoUnavailable,
-)
-from youtube_transcript_api.formatters import TextFormatter
+import orjson
+
+if TYPE_CHECKING:
+    from youtube_transcript_api import FetchedTranscriptSnippet
 
 __all__ = [
     "export_transcript_to_markdown",
@@ -18,23 +18,28 @@ __all__ = [
     "is_youtube_url",
 ]
 
-# YouTube URL patterns (video ID is always 11 characters)
-YOUTUBE_PATTERNS = [
-    r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})",
-    r"(?:https?://)?(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})",
-    r"(?:https?://)?(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})",
-    r"(?:https?://)?(?:www\.)?youtube\.com/shorts/([a-zA-Z0-9_-]{11})",
-    r"(?:https?://)?youtu\.be/([a-zA-Z0-9_-]{11})",
-]
+# YouTube URL pattern covering watch, embed, v, shorts and youtu.be links
+# (video ID is always 11 characters)
+YOUTUBE_PATTERN = re.compile(
+    r"(?:https?://)?"
+    r"(?:(?:www\.)?youtube\.com/(?:watch\?v=|embed/|v/|shorts/)|youtu\.be/)"
+    r"([a-zA-Z0-9_-]{11})"
+)
+
+# Fetched transcripts are cached on disk so re-exporting a video skips the network
+TRANSCRIPT_CACHE_DIR = Path.home() / ".cache" / "anki-api" / "yt"
+TRANSCRIPT_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # seconds
 
 
+# Bounded so long-running backend workers don't grow without limit
+@lru_cache(maxsize=1024)
 def extract_video_id(url: str) -> str | None:
     """Extract video ID from YouTube URL. Returns None if not a valid YouTube URL."""
-    for pattern in YOUTUBE_PATTERNS:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    # Every supported form contains "youtu"; skip the regex for other URLs
+    if "youtu" not in url:
+        return None
+    match = YOUTUBE_PATTERN.search(url)
+    return match.group(1) if match else None
 
 
 def is_youtube_url(url: str) -> bool:
@@ -42,12 +47,41 @@ def is_youtube_url(url: str) -> bool:
     return extract_video_id(url) is not None
 
 
+def _load_cached_transcript(video_id: str) -> list[str] | None:
+    """Return cached snippet texts for a video, or None if missing or stale."""
+    cache_path = TRANSCRIPT_CACHE_DIR / f"{video_id}.json"
+    try:
+        if time.time() - cache_path.stat().st_mtime > TRANSCRIPT_CACHE_MAX_AGE:
+            return None
+        data = orjson.loads(cache_path.read_bytes())
+        return [snippet["text"] for snippet in data["snippets"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        # Cache problems should never break fetching
+        return None
+
+
+def _save_cached_transcript(
+    video_id: str, language: str, snippets: "list[FetchedTranscriptSnippet]"
+) -> None:
+    """Write fetched transcript snippets to the on-disk cache (best effort)."""
+    data = {
+        "language": language,
+        "snippets": [{"start": s.start, "text": s.text} for s in snippets],
+    }
+    try:
+        TRANSCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (TRANSCRIPT_CACHE_DIR / f"{video_id}.json").write_bytes(orjson.dumps(data))
+    except OSError:
+        pass
+
+
 def export_transcript_to_markdown(url: str, output_dir: Path) -> Path:
     """
     Fetch YouTube transcript and save as clean text markdown.
 
-    Uses TextFormatter from youtube-transcript-api for clean, readable output
+    Writes one line per transcript snippet for clean, readable output
     without timestamps - optimized for reading and flashcard generation.
+    Transcripts are cached under TRANSCRIPT_CACHE_DIR for 30 days.
 
     Args:
         url: YouTube video URL
@@ -63,22 +97,27 @@ def export_transcript_to_markdown(url: str, output_dir: Path) -> Path:
     if not video_id:
         raise ValueError(f"Invalid YouTube URL: {url}")
 
-    try:
-        transcript = YouTubeTranscriptApi().fetch(video_id)
-    except TranscriptsDisabled:
-        raise ValueError(f"Transcripts are disabled for video: {video_id}")
-    except NoTranscriptFound:
-        raise ValueError(f"No transcript found for video: {video_id}")
-    except VideoUnavailable:
-        raise ValueError(f"Video unavailable: {video_id}")
-
-    # Use TextFormatter for clean, readable output (no timestamps)
-    formatter = TextFormatter()
-    text_content = formatter.format_transcript(transcript)
-
-    # Strip trailing whitespace from each line (TextFormatter adds trailing spaces)
-    lines = [line.rstrip() for line in text_content.splitlines()]
-    text_content = "\n".join(lines)
+    texts = _load_cached_transcript(video_id)
+    if texts is None:
+        # Deferred so importing this module (e.g. at backend startup) stays cheap
+        from youtube_transcript_api import YouTubeTranscriptApi
+        from youtube_transcript_api._errors import (
+            NoTranscriptFound,
+            TranscriptsDisabled,
+            VideoUnavailable,
+        )
+
+        try:
+            transcript = YouTubeTranscriptApi().fetch(video_id)
+        except TranscriptsDisabled:
+            raise ValueError(f"Transcripts are disabled for video: {video_id}")
+        except NoTranscriptFound:
+            raise ValueError(f"No transcript found for video: {video_id}")
+        except VideoUnavailable:
+            raise ValueError(f"Video unavailable: {video_id}")
+
+        _save_cached_transcript(video_id, transcript.language, transcript.snippets)
+        texts = [snippet.text for snippet in transcript.snippets]
 
     # Generate filename and save
     timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
@@ -86,6 +125,12 @@ def export_transcript_to_markdown(url: str, output_dir: Path) -> Path:
     output_path = output_dir / filename
 
     output_dir.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(text_content, encoding="utf-8")
+
+    # Stream snippets straight to disk rather than joining the whole transcript
+    # in memory; strip trailing whitespace (snippet text often has it)
+    with output_path.open("w", encoding="utf-8", buffering=1 << 16) as f:
+        for text in texts:
+            for line in text.splitlines():
+                f.write(f"{line.rstrip()}\n")
 
     return output_path
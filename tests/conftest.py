@@ -0,0 +1,32 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from src.anki_client import AnkiClient
+from web.backend.main import app
+from web.backend.routes.anki import get_anki_client
+
+
+class FakeAnkiClient(AnkiClient):
+    """AnkiClient that answers AnkiConnect actions from a canned table."""
+
+    def __init__(self):
+        super().__init__()
+        self.results: dict = {}
+        self.calls: list[tuple[str, dict | None]] = []
+
+    def _invoke(self, action, params=None):
+        self.calls.append((action, params))
+        result = self.results[action]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def fake_anki():
+    """Serve backend requests with a FakeAnkiClient instead of AnkiConnect."""
+    fake = FakeAnkiClient()
+    app.dependency_overrides[get_anki_client] = lambda: fake
+    yield fake
+    app.dependency_overrides.clear()
@@ -0,0 +1,47 @@
+"""Tests for the AnkiConnect routes of the web backend."""
+
+from fastapi.testclient import TestClient
+
+from src.anki_client import AnkiConnectError
+from web.backend.main import app
+
+
+def card_request(front: str) -> dict:
+    return {
+        "front": front,
+        "back": "Answer",
+        "context": "",
+        "tags": ["test"],
+        "source": "",
+        "deck": "Default",
+        "model": "Basic",
+    }
+
+
+def test_add_batch_sends_one_add_notes_call(fake_anki):
+    fake_anki.results["addNotes"] = [11, None]
+
+    response = TestClient(app).post(
+        "/api/anki/add_batch", json=[card_request("Q1?"), card_request("Q2?")]
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"success": True, "note_id": 11, "error": None},
+        {"success": False, "note_id": None, "error": "Note could not be added"},
+    ]
+    [(action, params)] = fake_anki.calls
+    assert action == "addNotes"
+    assert [note["fields"]["Front"] for note in params["notes"]] == ["Q1?", "Q2?"]
+
+
+def test_add_batch_reports_anki_errors_per_card(fake_anki):
+    fake_anki.results["addNotes"] = AnkiConnectError("collection is not available")
+
+    response = TestClient(app).post(
+        "/api/anki/add_batch", json=[card_request("Q1?"), card_request("Q2?")]
+    )
+
+    assert response.status_code == 200
+    assert [item["success"] for item in response.json()] == [False, False]
+    assert "collection is not available" in response.json()[0]["error"]
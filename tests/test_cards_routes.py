@@ -0,0 +1,240 @@
+"""Tests for the card file routes of the web backend."""
+
+import asyncio
+import itertools
+import json
+import os
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from src.schema import Flashcard, load_cards_from_json, save_cards_to_json
+from web.backend.main import app
+from web.backend.routes import cards as cards_routes
+
+
+class SlowAnkiClient:
+    """Stand-in for AnkiClient whose calls block long enough to interleave."""
+
+    def __init__(self):
+        self.added: list[dict] = []
+        self._ids = itertools.count(1000)
+
+    def add_note(self, **note):
+        time.sleep(0.05)
+        self.added.append(note)
+        return next(self._ids)
+
+
+@pytest.fixture
+def cards_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cards_routes, "CARDS_DIR", tmp_path)
+    cards_routes._card_cache.clear()
+    cards_routes._response_cache.clear()
+    return tmp_path
+
+
+@pytest.fixture
+def api(fake_anki):
+    """TestClient for the backend app, with the fake Anki client it talks to."""
+    return TestClient(app), fake_anki
+
+
+def write_cards(directory, name, count):
+    cards = [Flashcard(front=f"Q{i}?", back=f"A{i}") for i in range(count)]
+    save_cards_to_json(cards, str(directory / name))
+
+
+def corrupt_card_file(directory, name, old, new):
+    write_cards(directory, name, 2)
+    path = directory / name
+    path.write_text(path.read_text(encoding="utf-8").replace(old, new, 1))
+
+
+def assert_listed_as_unloadable(client, name):
+    listing = client.get("/api/cards/files")
+    detail = client.get(f"/api/cards/{name}")
+
+    assert listing.json()["files"][0]["total_cards"] == 0
+    assert detail.status_code == 400
+
+
+def test_get_cards_reflects_external_edits_after_caching(api, cards_dir):
+    client, _ = api
+    write_cards(cards_dir, "x.json", 1)
+    client.get("/api/cards/x.json")
+
+    write_cards(cards_dir, "x.json", 3)
+    response = client.get("/api/cards/x.json")
+
+    assert response.json()["total"] == 3
+
+
+def test_file_stat_skips_file_removed_after_listing(cards_dir):
+    write_cards(cards_dir, "gone.json", 1)
+    with os.scandir(cards_dir) as it:
+        [entry] = it
+    (cards_dir / "gone.json").unlink()
+
+    assert cards_routes._file_stat(entry) is None
+
+
+def test_list_card_files_counts_statuses_after_save(api, cards_dir):
+    client, _ = api
+    write_cards(cards_dir, "l.json", 3)
+    client.post("/api/cards/l.json/1/skip")
+
+    response = client.get("/api/cards/files")
+
+    assert response.json()["files"] == [
+        {
+            "filename": "l.json",
+            "total_cards": 3,
+            "added_cards": 0,
+            "skipped_cards": 1,
+            "pending_cards": 2,
+        }
+    ]
+
+
+def test_list_card_files_does_not_count_unknown_fields(api, cards_dir):
+    client, _ = api
+    corrupt_card_file(cards_dir, "bad.json", '"deck":', '"dek":')
+
+    assert_listed_as_unloadable(client, "bad.json")
+
+
+def test_list_card_files_does_not_count_invalid_json(api, cards_dir):
+    client, _ = api
+    corrupt_card_file(cards_dir, "bad.json", ',\n    "deck"', '\n    "deck"')
+
+    assert_listed_as_unloadable(client, "bad.json")
+
+
+def test_get_cards_returns_304_for_matching_etag(api, cards_dir):
+    client, _ = api
+    write_cards(cards_dir, "e.json", 1)
+
+    first = client.get("/api/cards/e.json")
+    etag = first.headers["etag"]
+    second = client.get("/api/cards/e.json", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert second.content == b""
+
+
+def test_concurrent_approve_and_skip_keep_both_updates(cards_dir):
+    write_cards(cards_dir, "a.json", 2)
+    client = SlowAnkiClient()
+
+    async def run():
+        await asyncio.gather(
+            cards_routes.approve_card("a.json", 0, client=client),
+            cards_routes.skip_card("a.json", 1),
+        )
+
+    asyncio.run(run())
+
+    saved = load_cards_from_json(str(cards_dir / "a.json"))
+    assert [card.status for card in saved] == ["added", "skipped"]
+
+
+def test_concurrent_approve_of_same_card_adds_one_note(cards_dir):
+    write_cards(cards_dir, "b.json", 1)
+    client = SlowAnkiClient()
+
+    async def run():
+        return await asyncio.gather(
+            cards_routes.approve_card("b.json", 0, client=client),
+            cards_routes.approve_card("b.json", 0, client=client),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert len(client.added) == 1
+    assert first.card.anki_id == second.card.anki_id == 1000
+
+
+def test_approve_all_adds_only_pending_cards_in_one_call(api, cards_dir):
+    client, anki = api
+    cards = [
+        Flashcard(front="Q0?", back="A0"),
+        Flashcard(front="Q1?", back="A1", status="skipped"),
+        Flashcard(front="Q2?", back="A2"),
+    ]
+    save_cards_to_json(cards, str(cards_dir / "all.json"))
+    # Anki rejects the second pending note (e.g. a duplicate)
+    anki.results["addNotes"] = [1001, None]
+
+    response = client.post("/api/cards/all.json/approve_all")
+
+    assert response.status_code == 200
+    assert [c["card"]["status"] for c in response.json()["cards"]] == [
+        "added",
+        "skipped",
+        "pending",
+    ]
+    [(action, params)] = anki.calls
+    assert action == "addNotes"
+    assert [n["fields"]["Front"] for n in params["notes"]] == ["Q0?", "Q2?"]
+    saved = load_cards_from_json(str(cards_dir / "all.json"))
+    assert [(c.status, c.anki_id) for c in saved] == [
+        ("added", 1001),
+        ("skipped", None),
+        ("pending", None),
+    ]
+
+
+def test_approve_all_without_pending_cards_skips_anki(api, cards_dir):
+    client, anki = api
+    cards = [Flashcard(front="Q?", back="A", status="skipped")]
+    save_cards_to_json(cards, str(cards_dir / "done.json"))
+
+    response = client.post("/api/cards/done.json/approve_all")
+
+    assert response.status_code == 200
+    assert anki.calls == []
+
+
+def test_card_response_rejects_mistyped_card_fields():
+    card = Flashcard.from_dict({"front": "Q?", "back": "A", "context": None})
+
+    with pytest.raises(ValidationError):
+        cards_routes.flashcard_to_response(card)
+
+
+def test_stream_cards_sends_header_then_one_card_per_line(api, cards_dir):
+    client, _ = api
+    cards = [Flashcard(front="Q0?", back="A0"), Flashcard(front="", back="A1")]
+    save_cards_to_json(cards, str(cards_dir / "s.json"))
+
+    response = client.get("/api/cards/s.json/stream")
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    header, *lines = [json.loads(line) for line in response.text.splitlines()]
+    assert header == {"filename": "s.json", "total": 2}
+    assert [line["index"] for line in lines] == [0, 1]
+    assert lines[0]["card"]["front"] == "Q0?"
+    assert lines[1]["warnings"]
+
+
+def test_get_cards_reflects_saves_after_caching(api, cards_dir):
+    client, _ = api
+    write_cards(cards_dir, "c.json", 2)
+    first = client.get("/api/cards/c.json")
+
+    client.put("/api/cards/c.json/0", json={"front": "Changed question?"})
+    client.post("/api/cards/c.json/1/skip")
+    second = client.get(
+        "/api/cards/c.json", headers={"If-None-Match": first.headers["etag"]}
+    )
+
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+    cards = second.json()["cards"]
+    assert cards[0]["card"]["front"] == "Changed question?"
+    assert cards[1]["card"]["status"] == "skipped"
@@ -0,0 +1,210 @@
+"""Tests for the card generation routes of the web backend."""
+
+import asyncio
+import os
+import signal
+
+import pytest
+from claude_agent_sdk import ToolResultBlock, UserMessage
+from fastapi import WebSocketDisconnect
+
+from web.backend.routes import generate
+from web.backend.routes.generate import (
+    AgentPool,
+    AgentWorker,
+    GenerationSession,
+    _parse_saved_cards_filename,
+    _parse_scraped_filename,
+)
+
+SCRAPE_OUTPUT = """Scraping: https://example.com/article
+Output directory: /home/user/anki-api/scraped/
+
+✓ Scraped content saved to: scraped/example-article.md
+
+Next steps:
+  1. Read the content: cat scraped/example-article.md
+  2. Generate flashcards: /create-anki-cards
+"""
+
+
+def test_parse_scraped_filename_reads_saved_to_line():
+    assert _parse_scraped_filename(SCRAPE_OUTPUT) == "example-article.md"
+
+
+def test_parse_scraped_filename_ignores_later_hints():
+    output = SCRAPE_OUTPUT.replace(
+        "cat scraped/example-article.md", "cat scraped/other.md"
+    )
+
+    assert _parse_scraped_filename(output) == "example-article.md"
+
+
+class DisconnectedSession(GenerationSession):
+    """Session whose client has gone away, so every send fails."""
+
+    def __init__(self):
+        super().__init__("test", websocket=None)
+        self.unsent: list[tuple[str, dict]] = []
+
+    async def send_event(self, event_type: str, data: dict):
+        self.unsent.append((event_type, data))
+        raise WebSocketDisconnect()
+
+
+def test_stream_scrape_output_kills_script_when_client_leaves():
+    async def run():
+        # The subshell keeps the pipes open after its parent is killed
+        proc = await asyncio.create_subprocess_exec(
+            "sh",
+            "-c",
+            "echo progress; (sleep 30)",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+        with pytest.raises(WebSocketDisconnect):
+            await asyncio.wait_for(
+                DisconnectedSession()._stream_scrape_output(proc), timeout=5
+            )
+        return proc.returncode
+
+    assert asyncio.run(run()) == -signal.SIGKILL
+
+
+def test_send_event_keeps_distinct_statuses_and_drops_repeats():
+    async def run():
+        session = GenerationSession("test", websocket=None)
+        for line in [
+            "Scraping: url",
+            "Output directory: scraped/",
+            "Output directory: scraped/",
+        ]:
+            await session.send_event("status", {"message": line, "step": "scraping"})
+        return [
+            session.out_queue.get_nowait() for _ in range(session.out_queue.qsize())
+        ]
+
+    queued = asyncio.run(run())
+
+    assert [event["data"]["message"] for event in queued] == [
+        "Scraping: url",
+        "Output directory: scraped/",
+    ]
+
+
+class FlakyClient:
+    """Stand-in for ClaudeSDKClient whose first instance fails to connect."""
+
+    instances = 0
+
+    def __init__(self, options):
+        self.options = options
+        self.works = FlakyClient.instances > 0
+        FlakyClient.instances += 1
+
+    async def connect(self):
+        if not self.works:
+            raise ConnectionError("CLI exited")
+
+    async def disconnect(self):
+        pass
+
+
+def test_agent_pool_replaces_spare_that_stopped(monkeypatch):
+    monkeypatch.setattr(generate, "ClaudeSDKClient", FlakyClient)
+    FlakyClient.instances = 0
+
+    async def run():
+        pool = AgentPool(size=1)
+        pool._refill()
+        await asyncio.sleep(0)  # let the spare's connect fail
+        agent = await pool.acquire()
+        usable = agent.usable
+        await agent.close()
+        await pool.close()
+        return usable
+
+    assert asyncio.run(run())
+
+
+class ChattyClient:
+    """Stand-in for ClaudeSDKClient that streams many response messages."""
+
+    def __init__(self, options):
+        self.options = options
+
+    async def connect(self):
+        pass
+
+    async def query(self, prompt):
+        self.prompt = prompt
+
+    async def receive_response(self):
+        for i in range(3 * generate.AGENT_QUEUE_SIZE):
+            yield i
+
+    async def disconnect(self):
+        pass
+
+
+def test_agent_worker_pauses_stream_while_reader_is_behind(monkeypatch):
+    monkeypatch.setattr(generate, "ClaudeSDKClient", ChattyClient)
+
+    async def run():
+        worker = AgentWorker()
+        await worker.wait_ready()
+        responses = worker.responses("prompt")
+        first = await anext(responses)
+        await asyncio.sleep(0.01)  # let the worker run ahead as far as it can
+        buffered = worker._messages.qsize()
+        rest = [message async for message in responses]
+        await worker.close()
+        return first, buffered, rest
+
+    first, buffered, rest = asyncio.run(run())
+
+    assert buffered == generate.AGENT_QUEUE_SIZE
+    assert [first, *rest] == list(range(3 * generate.AGENT_QUEUE_SIZE))
+
+
+def test_parse_saved_cards_filename_reads_save_step_output():
+    assert (
+        _parse_saved_cards_filename("SUCCESS: Saved 12 cards to cards/py_1.json")
+        == "py_1.json"
+    )
+    assert _parse_saved_cards_filename("Saved to: cards/py_2.json\n") == "py_2.json"
+    assert _parse_saved_cards_filename("Wrote cards/_generate_temp.py") is None
+
+
+def test_find_output_file_prefers_reported_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(generate, "CARDS_DIR", tmp_path)
+    (tmp_path / "mine.json").write_text("[]")
+    # Another session's file, written later
+    (tmp_path / "other.json").write_text("[]")
+    session = GenerationSession("test", websocket=None)
+    message = UserMessage(
+        content=[
+            ToolResultBlock(
+                tool_use_id="1",
+                content=[{"type": "text", "text": "Saved to: cards/mine.json"}],
+            )
+        ]
+    )
+
+    async def run():
+        await session.process_sdk_message(message)
+        return await session.find_output_file()
+
+    assert asyncio.run(run()) == str(tmp_path / "mine.json")
+
+
+def test_find_output_file_falls_back_to_newest_new_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(generate, "CARDS_DIR", tmp_path)
+    for name, mtime_ns in [("old.json", 1), ("a.json", 3), ("b.json", 2)]:
+        (tmp_path / name).write_text("[]")
+        os.utime(tmp_path / name, ns=(mtime_ns, mtime_ns))
+    session = GenerationSession("test", websocket=None)
+    session._cards_mtime_ns = 1
+
+    assert asyncio.run(session.find_output_file()) == str(tmp_path / "a.json")
@@ -1,8 +1,13 @@
+from datetime import UTC, datetime
+
 from src.schema import (
     Flashcard,
     ValidationWarning,
     convert_newlines_to_html,
+    load_cards_from_json,
+    save_cards_to_json,
     validate_card,
+    validate_cards,
 )
 
 
@@ -145,6 +150,22 @@ def test_validate_card_short_answer_no_warning():
     assert len(warnings) == 0
 
 
+def test_validate_cards_matches_validate_card_per_card():
+    """Batch validation returns one warning list per card, in order."""
+    cards = [
+        Flashcard(front="What is X?", back="Y"),
+        Flashcard(front="", back=""),
+        Flashcard(front="What is Z?", back="  "),
+    ]
+
+    results = validate_cards(cards)
+
+    assert [[w.message for w in ws] for ws in results] == [
+        [w.message for w in validate_card(card)] for card in cards
+    ]
+    assert [len(ws) for ws in results] == [0, 2, 1]
+
+
 def test_validation_warning_str_representation():
     """ValidationWarning should have proper string representation."""
     warning = ValidationWarning("Test message", "error")
@@ -153,3 +174,61 @@ def test_validation_warning_str_representation():
 
     warning_info = ValidationWarning("Info message", "info")
     assert "ℹ️" in str(warning_info)
+
+
+def test_save_and_load_cards_round_trip(tmp_path):
+    """Cards survive a save/load cycle, including unicode and timestamps."""
+    added_at = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=UTC)
+    cards = [
+        Flashcard(front="Qu'est-ce que λ?", back="Lambda → function", tags=["fr"]),
+        Flashcard(
+            front="What is X?",
+            back="Y",
+            anki_id=42,
+            status="added",
+            added_at=added_at,
+        ),
+    ]
+    path = tmp_path / "cards.json"
+
+    save_cards_to_json(cards, str(path))
+    loaded = load_cards_from_json(str(path))
+
+    assert loaded == cards
+    assert "λ" in path.read_text(encoding="utf-8")
+    assert loaded[1].added_at == added_at
+
+
+def test_save_and_reload_keeps_loosely_typed_fields(tmp_path):
+    """Hand-edited string tags and unparsed timestamps survive a re-save."""
+    path = tmp_path / "cards.json"
+    path.write_text(
+        '[{"front": "Q?", "back": "A", "tags": "python", "added_at": 1714566615}]',
+        encoding="utf-8",
+    )
+
+    save_cards_to_json(load_cards_from_json(str(path)), str(path))
+    [card] = load_cards_from_json(str(path))
+
+    assert card.tags == "python"
+    assert card.added_at == 1714566615
+
+
+def test_from_dict_interns_repeated_strings():
+    """Repeated tag and deck values share a single string object."""
+    cards = [
+        Flashcard.from_dict(
+            {"front": "Q?", "back": "A", "tags": ["".join(["py", "thon"])], "deck": d}
+        )
+        for d in ("".join(["Lang", "uages"]), "".join(["Langu", "ages"]))
+    ]
+
+    assert cards[0].tags[0] is cards[1].tags[0]
+    assert cards[0].deck is cards[1].deck
+
+
+def test_from_dict_keeps_non_list_tags_unchanged():
+    """A string tags value is not split into characters."""
+    card = Flashcard.from_dict({"front": "Q?", "back": "A", "tags": "python"})
+
+    assert card.tags == "python"
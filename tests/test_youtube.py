@@ -1,6 +1,17 @@
 """Tests for YouTube transcript extraction utilities."""
 
-from src.youtube import extract_video_id, is_youtube_url
+from youtube_transcript_api import (
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    YouTubeTranscriptApi,
+)
+
+from src import youtube
+from src.youtube import (
+    export_transcript_to_markdown,
+    extract_video_id,
+    is_youtube_url,
+)
 
 
 class TestYouTubeUrlDetection:
@@ -69,3 +80,47 @@ class TestYouTubeUrlDetection:
         url = "https://youtu.be/abc_-123XYZ"
         assert is_youtube_url(url)
         assert extract_video_id(url) == "abc_-123XYZ"
+
+
+class TestTranscriptCache:
+    """Tests for the on-disk transcript cache."""
+
+    VIDEO_URL = "https://youtu.be/dQw4w9WgXcQ"
+
+    def test_fetch_populates_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(youtube, "TRANSCRIPT_CACHE_DIR", tmp_path / "cache")
+        transcript = FetchedTranscript(
+            snippets=[
+                FetchedTranscriptSnippet(text="Hello  ", start=0.0, duration=1.0),
+                FetchedTranscriptSnippet(text="world", start=1.0, duration=1.0),
+            ],
+            video_id="dQw4w9WgXcQ",
+            language="English",
+            language_code="en",
+            is_generated=False,
+        )
+        monkeypatch.setattr(
+            YouTubeTranscriptApi, "fetch", lambda _self, _video_id: transcript
+        )
+
+        output = export_transcript_to_markdown(self.VIDEO_URL, tmp_path / "out")
+
+        assert output.read_text(encoding="utf-8") == "Hello\nworld\n"
+        assert (tmp_path / "cache" / "dQw4w9WgXcQ.json").exists()
+
+    def test_cache_hit_skips_fetch(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "dQw4w9WgXcQ.json").write_text(
+            '{"language": "English", "snippets": [{"start": 0.0, "text": "Cached"}]}'
+        )
+        monkeypatch.setattr(youtube, "TRANSCRIPT_CACHE_DIR", cache_dir)
+
+        def fail_fetch(_self, _video_id):
+            raise AssertionError("fetch should not be called on a cache hit")
+
+        monkeypatch.setattr(YouTubeTranscriptApi, "fetch", fail_fetch)
+
+        output = export_transcript_to_markdown(self.VIDEO_URL, tmp_path / "out")
+
+        assert output.read_text(encoding="utf-8") == "Cached\n"
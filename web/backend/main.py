@@ -1,29 +1,51 @@
 """FastAPI application for Anki card review web interface."""
 
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.anki_client import AnkiClient
+
 from .routes import anki, cards, files, generate
 
-# Global activity tracker for idle detection
-_last_activity: float = time.time()
+# Global activity tracker for idle detection (monotonic, immune to clock jumps)
+_last_activity_ns: int = time.monotonic_ns()
+
+# Polling endpoints that shouldn't count as user activity
+_UNTRACKED_PATHS = frozenset({"/api/health", "/api/activity"})
+
+# Origins allowed by CORS (Starlette expects a sequence here)
+_ALLOWED_ORIGINS = (
+    "http://localhost:5173",  # Vite default
+    "http://127.0.0.1:5173",
+    # TODO: Parameterize this for production deployment
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Share one AnkiConnect client (and its connection pool) across requests."""
+    app.state.anki = AnkiClient()
+    yield
+    app.state.anki.close()
+    # Stop warm agent processes kept for card generation
+    await generate.agent_pool.close()
+
 
 app = FastAPI(
     title="Anki Card Review API",
     description="Web interface for reviewing and adding Anki flashcards",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware for Vite dev server
 app.add_middleware(
     CORSMiddleware,  # type: ignore
-    allow_origins=[
-        "http://localhost:5173",  # Vite default
-        "http://127.0.0.1:5173",
-        # TODO: Parameterize this for production deployment
-    ],
+    allow_origins=_ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -39,8 +61,9 @@ app.include_router(files.router, prefix="/api/files", tags=["files"])
 @app.middleware("http")
 async def track_activity(request: Request, call_next):
     """Track last API activity for idle detection."""
-    global _last_activity
-    _last_activity = time.time()
+    global _last_activity_ns
+    if request.url.path not in _UNTRACKED_PATHS:
+        _last_activity_ns = time.monotonic_ns()
     return await call_next(request)
 
 
@@ -52,5 +75,14 @@ async def health_check():
 
 @app.get("/api/activity")
 async def get_activity():
-    """Return timestamp of last API activity for idle detection."""
-    return {"last_activity": _last_activity}
+    """Return time of last API activity for idle detection.
+
+    ``last_activity`` is a wall-clock Unix timestamp derived from the monotonic
+    idle time; ``last_activity_ns`` is the raw ``time.monotonic_ns()`` value.
+    """
+    idle_seconds = (time.monotonic_ns() - _last_activity_ns) / 1e9
+    return {
+        "last_activity": time.time() - idle_seconds,
+        "last_activity_ns": _last_activity_ns,
+        "idle_seconds": idle_seconds,
+    }
@@ -1,6 +1,6 @@
 """Anki integration routes."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 
 from src.anki_client import AnkiClient, AnkiConnectError
 from src.schema import Flashcard
@@ -10,15 +10,14 @@ from ..models import AddCardRequest, AddCardResponse, AnkiStatusResponse
 router = APIRouter()
 
 
-def get_anki_client() -> AnkiClient:
-    """Get AnkiConnect client instance."""
-    return AnkiClient()
+def get_anki_client(request: Request) -> AnkiClient:
+    """Get the shared AnkiConnect client created in the app lifespan."""
+    return request.app.state.anki
 
 
 @router.get("/ping", response_model=AnkiStatusResponse)
-async def ping_anki():
+async def ping_anki(client: AnkiClient = Depends(get_anki_client)):
     """Check if Anki is connected and responsive."""
-    client = get_anki_client()
     try:
         connected = client.ping()
         return AnkiStatusResponse(connected=connected)
@@ -27,9 +26,8 @@ async def ping_anki():
 
 
 @router.get("/decks", response_model=list[str])
-async def list_decks():
+async def list_decks(client: AnkiClient = Depends(get_anki_client)):
     """List available Anki decks."""
-    client = get_anki_client()
     try:
         return client.get_decks()
     except AnkiConnectError as e:
@@ -37,22 +35,17 @@ async def list_decks():
 
 
 @router.get("/models", response_model=list[str])
-async def list_models():
+async def list_models(client: AnkiClient = Depends(get_anki_client)):
     """List available Anki note models."""
-    client = get_anki_client()
     try:
         return client.get_models()
     except AnkiConnectError as e:
         raise HTTPException(status_code=503, detail=str(e))
 
 
-@router.post("/add", response_model=AddCardResponse)
-async def add_card(request: AddCardRequest):
-    """Add a card to Anki."""
-    client = get_anki_client()
-
-    # Create Flashcard object to use its to_anki_note conversion
-    card = Flashcard(
+def request_to_flashcard(request: AddCardRequest) -> Flashcard:
+    """Build a Flashcard from an add request to reuse its to_anki_note conversion."""
+    return Flashcard(
         front=request.front,
         back=request.back,
         context=request.context,
@@ -62,7 +55,13 @@ async def add_card(request: AddCardRequest):
         model=request.model,
     )
 
-    anki_note = card.to_anki_note()
+
+@router.post("/add", response_model=AddCardResponse)
+async def add_card(
+    request: AddCardRequest, client: AnkiClient = Depends(get_anki_client)
+):
+    """Add a card to Anki."""
+    anki_note = request_to_flashcard(request).to_anki_note()
 
     try:
         note_id = client.add_note(
@@ -74,3 +73,23 @@ async def add_card(request: AddCardRequest):
         return AddCardResponse(success=True, note_id=note_id)
     except AnkiConnectError as e:
         return AddCardResponse(success=False, error=str(e))
+
+
+@router.post("/add_batch", response_model=list[AddCardResponse])
+async def add_cards(
+    requests: list[AddCardRequest], client: AnkiClient = Depends(get_anki_client)
+):
+    """Add several cards to Anki with a single AnkiConnect addNotes call."""
+    notes = [request_to_flashcard(request).to_anki_note() for request in requests]
+
+    try:
+        note_ids = client.add_notes_batch(notes)
+    except AnkiConnectError as e:
+        return [AddCardResponse(success=False, error=str(e)) for _ in requests]
+
+    return [
+        AddCardResponse(success=True, note_id=note_id)
+        if note_id is not None
+        else AddCardResponse(success=False, error="Note could not be added")
+        for note_id in note_ids
+    ]
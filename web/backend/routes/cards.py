@@ -1,17 +1,30 @@
 """Card file management routes."""
 
+import asyncio
+import copy
+import os
 import re
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
 from datetime import UTC, datetime
 from pathlib import Path
+from weakref import WeakValueDictionary
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 
 from src.anki_client import AnkiClient, AnkiConnectError
 from src.schema import (
     Flashcard,
+    ValidationWarning,
     load_cards_from_json,
     save_cards_to_json,
     validate_card,
+    validate_cards,
 )
 
 from ..models import (
@@ -23,22 +36,89 @@ from ..models import (
     FileStat,
     ValidationWarningResponse,
 )
+from .anki import get_anki_client
 
 router = APIRouter()
 
 # Cards directory relative to project root
 CARDS_DIR = Path(__file__).parent.parent.parent.parent / "cards"
 
+_FILENAME_RE = re.compile(r"[\w\-]+\.json")
+
+# Parsed card files keyed by path, reused while (mtime_ns, size) is unchanged
+_CARD_CACHE_SIZE = 256
+_card_cache: OrderedDict[str, tuple[int, int, list[Flashcard]]] = OrderedDict()
+_card_cache_lock = threading.Lock()
+
+# get_cards responses keyed by filename, valid while the cached card list is
+# the same object (holding the list keeps the identity check sound)
+_response_cache: OrderedDict[str, tuple[list[Flashcard], CardsFileResponse]] = (
+    OrderedDict()
+)
+
+# Per-file locks serializing load-modify-save handlers; an entry lives only
+# while some request holds its lock
+_file_locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+
+# Key lines save_cards_to_json writes for every card, used by _count_statuses
+_CARD_KEY_LINES = tuple(f'\n    "{f.name}":'.encode() for f in fields(Flashcard))
+
+# Bounded pool for stat+parse fan-out in list_card_files
+_stats_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="card-stats")
+
+
+def load_cards_cached(
+    file_path: Path, st: os.stat_result | None = None
+) -> list[Flashcard]:
+    """
+    Load cards from a file, skipping the parse if it hasn't changed on disk.
+
+    The returned list is shared with the cache and must not be mutated;
+    routes that edit cards should go through load_cards_for_update().
+    Pass st when the caller already has the file's stat result.
+    """
+    key = str(file_path)
+    if st is None:
+        st = file_path.stat()
+    with _card_cache_lock:
+        entry = _card_cache.get(key)
+        if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+            _card_cache.move_to_end(key)
+            return entry[2]
+
+    cards = load_cards_from_json(key)
+    with _card_cache_lock:
+        _card_cache[key] = (st.st_mtime_ns, st.st_size, cards)
+        if len(_card_cache) > _CARD_CACHE_SIZE:
+            _card_cache.popitem(last=False)
+    return cards
+
+
+def load_cards_for_update(file_path: Path) -> list[Flashcard]:
+    """Load cards as private copies that are safe to modify and save."""
+    return [copy.copy(card) for card in load_cards_cached(file_path)]
+
+
+def save_cards(cards: list[Flashcard], file_path: Path) -> None:
+    """Save cards and drop the stale cache entry for the file."""
+    save_cards_to_json(cards, str(file_path))
+    with _card_cache_lock:
+        _card_cache.pop(str(file_path), None)
+
+
+def _file_lock(filename: str) -> asyncio.Lock:
+    """Return the lock guarding read-modify-write of one card file."""
+    lock = _file_locks.get(filename)
+    if lock is None:
+        lock = _file_locks[filename] = asyncio.Lock()
+    return lock
+
 
 def validate_filename(filename: str) -> bool:
     """Validate filename to prevent path traversal attacks."""
-    if not filename:
-        return False
     # Only allow alphanumeric, underscore, hyphen, and .json extension
-    if not re.match(r"^[\w\-]+\.json$", filename):
-        return False
-    # No path separators
-    return not ("/" in filename or "\\" in filename)
+    # (\w excludes path separators, so no separate check is needed)
+    return bool(filename) and _FILENAME_RE.fullmatch(filename) is not None
 
 
 def flashcard_to_response(card: Flashcard) -> CardResponse:
@@ -58,10 +138,14 @@ def flashcard_to_response(card: Flashcard) -> CardResponse:
 
 
 def get_card_with_validation(
-    card: Flashcard, index: int, total: int
+    card: Flashcard,
+    index: int,
+    total: int,
+    warnings: list[ValidationWarning] | None = None,
 ) -> CardWithValidation:
-    """Get card with its validation warnings."""
-    warnings = validate_card(card)
+    """Get card with its validation warnings (computed if not provided)."""
+    if warnings is None:
+        warnings = validate_card(card)
     return CardWithValidation(
         card=flashcard_to_response(card),
         warnings=[
@@ -73,155 +157,325 @@ def get_card_with_validation(
     )
 
 
+def _count_statuses(data: bytes) -> tuple[int, int, int, int] | None:
+    """
+    Count (total, added, skipped, pending) cards by scanning raw JSON bytes.
+
+    The scan is only trusted for the layout save_cards_to_json writes: a
+    top-level array whose objects each hold every Flashcard field, one per
+    line. Escaped quotes and newlines inside card text can't match these
+    literals. Anything else (other formatting, missing or unknown keys, a
+    truncated file) returns None, so the caller falls back to a full parse.
+    """
+    if not (data.startswith(b"[") and data.endswith(b"]\n")):
+        return None
+    total = data.count(b"\n  {")
+    keys = len(_CARD_KEY_LINES)
+    if (
+        data.count(b'\n    "') != total * keys
+        or data.count(b',\n    "') != total * (keys - 1)
+        or data.count(b"\n  },\n  {") != max(total - 1, 0)
+    ):
+        return None
+    if any(data.count(key) != total for key in _CARD_KEY_LINES):
+        return None
+    added = data.count(b'\n    "status": "added"')
+    skipped = data.count(b'\n    "status": "skipped"')
+    pending = data.count(b'\n    "status": "pending"')
+    if added + skipped + pending != total:
+        return None
+    return total, added, skipped, pending
+
+
+def _file_stat(entry: os.DirEntry[str]) -> tuple[int, FileStat] | None:
+    """
+    Return a card file's mtime and review statistics (run in a worker thread).
+
+    Returns None when the file was removed after the directory was listed.
+    """
+    try:
+        st = entry.stat()
+    except OSError:
+        return None
+    mtime_ns = st.st_mtime_ns
+    try:
+        f = Path(entry.path)
+        counts = _count_statuses(f.read_bytes())
+        if counts is None:
+            cards = load_cards_cached(f, st)
+
+            # Calculate statistics based on status field in a single pass
+            statuses = Counter(c.status for c in cards)
+            counts = (
+                len(cards),
+                statuses["added"],
+                statuses["skipped"],
+                statuses["pending"],
+            )
+        total, added_count, skipped_count, pending_count = counts
+
+        return mtime_ns, FileStat(
+            filename=entry.name,
+            total_cards=total,
+            added_cards=added_count,
+            skipped_cards=skipped_count,
+            pending_cards=pending_count,
+        )
+    except Exception:
+        return mtime_ns, FileStat(
+            filename=entry.name,
+            total_cards=0,
+            added_cards=0,
+            skipped_cards=0,
+            pending_cards=0,
+        )
+
+
+def _list_json_entries() -> list[os.DirEntry[str]]:
+    """List JSON files in CARDS_DIR (is_file() uses the type from readdir)."""
+    with os.scandir(CARDS_DIR) as it:
+        return [e for e in it if e.name.endswith(".json") and e.is_file()]
+
+
+def cards_file_response(filename: str, cards: list[Flashcard]) -> CardsFileResponse:
+    """Build the response for a whole cards file with validation warnings."""
+    all_warnings = validate_cards(cards)
+    cards_with_validation = [
+        get_card_with_validation(card, i, len(cards), warnings)
+        for i, (card, warnings) in enumerate(zip(cards, all_warnings, strict=True))
+    ]
+
+    return CardsFileResponse(
+        filename=filename,
+        cards=cards_with_validation,
+        total=len(cards),
+    )
+
+
 @router.get("/files", response_model=FileListResponse)
 async def list_card_files():
     """List available JSON card files with review statistics."""
-    if not CARDS_DIR.exists():
+    try:
+        entries = await asyncio.to_thread(_list_json_entries)
+    except FileNotFoundError:
         return FileListResponse(files=[])
 
-    files = []
-    for f in CARDS_DIR.iterdir():
-        if f.is_file() and f.suffix == ".json":
-            try:
-                cards = load_cards_from_json(str(f))
-
-                # Calculate statistics based on status field
-                added_count = sum(1 for c in cards if c.status == "added")
-                skipped_count = sum(1 for c in cards if c.status == "skipped")
-                pending_count = sum(1 for c in cards if c.status == "pending")
-
-                files.append(
-                    FileStat(
-                        filename=f.name,
-                        total_cards=len(cards),
-                        added_cards=added_count,
-                        skipped_cards=skipped_count,
-                        pending_cards=pending_count,
-                    )
-                )
-            except Exception:
-                files.append(
-                    FileStat(
-                        filename=f.name,
-                        total_cards=0,
-                        added_cards=0,
-                        skipped_cards=0,
-                        pending_cards=0,
-                    )
-                )
+    # Parse files concurrently off the event loop
+    loop = asyncio.get_running_loop()
+    results = [
+        result
+        for result in await asyncio.gather(
+            *(loop.run_in_executor(_stats_executor, _file_stat, e) for e in entries)
+        )
+        if result is not None
+    ]
 
     # Sort by modification time (most recent first)
-    files.sort(
-        key=lambda item: (CARDS_DIR / item.filename).stat().st_mtime, reverse=True
-    )
+    results.sort(key=lambda item: item[0], reverse=True)
 
-    return FileListResponse(files=files)
+    return FileListResponse(files=[stat for _, stat in results])
 
 
 @router.get("/{filename}", response_model=CardsFileResponse)
-async def get_cards(filename: str):
+async def get_cards(filename: str, request: Request, response: Response):
     """Load all cards from a JSON file with validation warnings."""
     if not validate_filename(filename):
         raise HTTPException(status_code=400, detail="Invalid filename")
 
     file_path = CARDS_DIR / filename
-    if not file_path.exists():
+    try:
+        st = await asyncio.to_thread(file_path.stat)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {filename}")
 
+    # Let clients revalidate with If-None-Match instead of re-downloading
+    etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+
     try:
-        cards = load_cards_from_json(str(file_path))
+        cards = await asyncio.to_thread(load_cards_cached, file_path, st)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    cards_with_validation = [
-        get_card_with_validation(card, i, len(cards)) for i, card in enumerate(cards)
-    ]
+    # The parse cache hands back the same list while the file is unchanged,
+    # so the response built from it can be reused as well
+    cached = _response_cache.get(filename)
+    if cached is not None and cached[0] is cards:
+        _response_cache.move_to_end(filename)
+        return cached[1]
 
-    return CardsFileResponse(
-        filename=filename,
-        cards=cards_with_validation,
-        total=len(cards),
-    )
+    file_response = cards_file_response(filename, cards)
+    _response_cache[filename] = (cards, file_response)
+    if len(_response_cache) > _CARD_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+    return file_response
 
 
-@router.put("/{filename}/{index}", response_model=CardWithValidation)
-async def update_card(filename: str, index: int, update: CardUpdate):
-    """Update a card's fields and return with new validation warnings."""
+@router.get("/{filename}/stream")
+async def stream_cards(filename: str):
+    """
+    Stream a cards file as NDJSON so clients can render before it's all sent.
+
+    The first line is {"filename": ..., "total": ...}; each following line
+    is one CardWithValidation, in file order.
+    """
     if not validate_filename(filename):
         raise HTTPException(status_code=400, detail="Invalid filename")
 
     file_path = CARDS_DIR / filename
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail=f"File not found: {filename}")
-
     try:
-        cards = load_cards_from_json(str(file_path))
+        cards = await asyncio.to_thread(load_cards_cached, file_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"File not found: {filename}")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    if index < 0 or index >= len(cards):
-        raise HTTPException(status_code=404, detail=f"Card index {index} out of range")
+    def generate_lines() -> Iterator[bytes]:
+        total = len(cards)
+        yield orjson.dumps(
+            {"filename": filename, "total": total},
+            option=orjson.OPT_APPEND_NEWLINE,
+        )
+        all_warnings = validate_cards(cards)
+        for i, (card, warnings) in enumerate(zip(cards, all_warnings, strict=True)):
+            card_with_validation = get_card_with_validation(card, i, total, warnings)
+            yield card_with_validation.model_dump_json().encode() + b"\n"
 
-    card = cards[index]
+    return StreamingResponse(generate_lines(), media_type="application/x-ndjson")
 
-    # Apply updates
-    if update.front is not None:
-        card.front = update.front
-    if update.back is not None:
-        card.back = update.back
-    if update.context is not None:
-        card.context = update.context
-    if update.tags is not None:
-        card.tags = update.tags
 
-    # Save back to file
-    save_cards_to_json(cards, str(file_path))
+@router.put("/{filename}/{index}", response_model=CardWithValidation)
+async def update_card(filename: str, index: int, update: CardUpdate):
+    """Update a card's fields and return with new validation warnings."""
+    if not validate_filename(filename):
+        raise HTTPException(status_code=400, detail="Invalid filename")
 
-    return get_card_with_validation(card, index, len(cards))
+    file_path = CARDS_DIR / filename
+    async with _file_lock(filename):
+        try:
+            cards = await asyncio.to_thread(load_cards_for_update, file_path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail=f"File not found: {filename}")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        if index < 0 or index >= len(cards):
+            raise HTTPException(
+                status_code=404, detail=f"Card index {index} out of range"
+            )
+
+        card = cards[index]
+        original = copy.copy(card)
+
+        # Apply updates
+        if update.front is not None:
+            card.front = update.front
+        if update.back is not None:
+            card.back = update.back
+        if update.context is not None:
+            card.context = update.context
+        if update.tags is not None:
+            card.tags = update.tags
+
+        # Save back to file, skipping the full rewrite when nothing changed
+        if card != original:
+            await asyncio.to_thread(save_cards, cards, file_path)
+
+        return get_card_with_validation(card, index, len(cards))
 
 
 @router.post("/{filename}/{index}/approve", response_model=CardWithValidation)
-async def approve_card(filename: str, index: int):
+async def approve_card(
+    filename: str, index: int, client: AnkiClient = Depends(get_anki_client)
+):
     """Approve a card: Add to Anki and save resulting ID and timestamp to file."""
     if not validate_filename(filename):
         raise HTTPException(status_code=400, detail="Invalid filename")
 
     file_path = CARDS_DIR / filename
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail=f"File not found: {filename}")
+    async with _file_lock(filename):
+        try:
+            cards = await asyncio.to_thread(load_cards_for_update, file_path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail=f"File not found: {filename}")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        if index < 0 or index >= len(cards):
+            raise HTTPException(
+                status_code=404, detail=f"Card index {index} out of range"
+            )
 
-    try:
-        cards = load_cards_from_json(str(file_path))
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        card = cards[index]
+
+        try:
+            if card.status == "added" and card.anki_id:
+                # Already approved, return as-is (idempotent)
+                pass
+            else:
+                anki_note = card.to_anki_note()
+                note_id = await asyncio.to_thread(
+                    client.add_note,
+                    deck_name=anki_note["deckName"],
+                    model_name=anki_note["modelName"],
+                    fields=anki_note["fields"],
+                    tags=anki_note["tags"],
+                )
+                card.anki_id = note_id
+                card.status = "added"
+                card.added_at = datetime.now(UTC)
+                await asyncio.to_thread(save_cards, cards, file_path)
 
-    if index < 0 or index >= len(cards):
-        raise HTTPException(status_code=404, detail=f"Card index {index} out of range")
+        except AnkiConnectError as e:
+            raise HTTPException(status_code=500, detail=f"Anki Connect Error: {e}")
 
-    card = cards[index]
-    client = AnkiClient()
+        return get_card_with_validation(card, index, len(cards))
 
-    try:
-        if card.status == "added" and card.anki_id:
-            # Already approved, return as-is (idempotent)
-            pass
-        else:
-            anki_note = card.to_anki_note()
-            note_id = client.add_note(
-                deck_name=anki_note["deckName"],
-                model_name=anki_note["modelName"],
-                fields=anki_note["fields"],
-                tags=anki_note["tags"],
-            )
-            card.anki_id = note_id
-            card.status = "added"
-            card.added_at = datetime.now(UTC)
-            save_cards_to_json(cards, str(file_path))
 
-    except AnkiConnectError as e:
-        raise HTTPException(status_code=500, detail=f"Anki Connect Error: {e}")
+@router.post("/{filename}/approve_all", response_model=CardsFileResponse)
+async def approve_all_cards(
+    filename: str, client: AnkiClient = Depends(get_anki_client)
+):
+    """Approve every pending card with one AnkiConnect call and one file save."""
+    if not validate_filename(filename):
+        raise HTTPException(status_code=400, detail="Invalid filename")
 
-    return get_card_with_validation(card, index, len(cards))
+    file_path = CARDS_DIR / filename
+    async with _file_lock(filename):
+        try:
+            cards = await asyncio.to_thread(load_cards_for_update, file_path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail=f"File not found: {filename}")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # Skipped cards stay skipped; added cards are left as-is (idempotent)
+        pending = [card for card in cards if card.status == "pending"]
+        if pending:
+            notes = [card.to_anki_note() for card in pending]
+            try:
+                note_ids = await asyncio.to_thread(client.add_notes_batch, notes)
+            except AnkiConnectError as e:
+                raise HTTPException(status_code=500, detail=f"Anki Connect Error: {e}")
+
+            # Notes Anki rejected (e.g. duplicates) come back as None and stay pending
+            added_at = datetime.now(UTC)
+            changed = False
+            for card, note_id in zip(pending, note_ids, strict=True):
+                if note_id is not None:
+                    card.anki_id = note_id
+                    card.status = "added"
+                    card.added_at = added_at
+                    changed = True
+
+            if changed:
+                await asyncio.to_thread(save_cards, cards, file_path)
+
+        return cards_file_response(filename, cards)
 
 
 @router.post("/{filename}/{index}/skip", response_model=CardWithValidation)
@@ -231,22 +485,24 @@ async def skip_card(filename: str, index: int):
         raise HTTPException(status_code=400, detail="Invalid filename")
 
     file_path = CARDS_DIR / filename
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail=f"File not found: {filename}")
-
-    try:
-        cards = load_cards_from_json(str(file_path))
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-    if index < 0 or index >= len(cards):
-        raise HTTPException(status_code=404, detail=f"Card index {index} out of range")
+    async with _file_lock(filename):
+        try:
+            cards = await asyncio.to_thread(load_cards_for_update, file_path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail=f"File not found: {filename}")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        if index < 0 or index >= len(cards):
+            raise HTTPException(
+                status_code=404, detail=f"Card index {index} out of range"
+            )
 
-    card = cards[index]
+        card = cards[index]
 
-    # Only update if not already processed (idempotent)
-    if card.status == "pending":
-        card.status = "skipped"
-        save_cards_to_json(cards, str(file_path))
+        # Only update if not already processed (idempotent)
+        if card.status == "pending":
+            card.status = "skipped"
+            await asyncio.to_thread(save_cards, cards, file_path)
 
-    return get_card_with_validation(card, index, len(cards))
+        return get_card_with_validation(card, index, len(cards))
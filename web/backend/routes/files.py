@@ -1,6 +1,9 @@
 """File browser routes for selecting content files."""
 
+import heapq
+import itertools
 import os
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Literal
@@ -16,6 +19,18 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 SCRAPED_DIR = PROJECT_ROOT / "scraped"
 CARDS_DIR = PROJECT_ROOT / "cards"
 
+# Resolved once for validate_project_path's prefix check
+_RESOLVED_PROJECT_DIRS = {
+    "scraped": str(SCRAPED_DIR.resolve()),
+    "cards": str(CARDS_DIR.resolve()),
+}
+
+# File extensions listed for each project directory
+PROJECT_SUFFIXES = {
+    "scraped": frozenset({".md"}),
+    "cards": frozenset({".json"}),
+}
+
 # Blacklist sensitive directories for system mode
 BLOCKED_PATHS = [
     Path("/etc"),
@@ -28,22 +43,22 @@ BLOCKED_PATHS = [
     Path("/usr/lib"),
 ]
 
+# String forms for is_path_blocked: a plain prefix test instead of relative_to
+_BLOCKED_DIRS = frozenset(str(p) for p in BLOCKED_PATHS)
+_BLOCKED_PREFIXES = tuple(str(p) + os.sep for p in BLOCKED_PATHS)
+
 
 def is_path_blocked(path: Path) -> bool:
     """Check if path is within blocked directories."""
     try:
-        resolved = path.resolve()
-        for blocked in BLOCKED_PATHS:
-            try:
-                resolved.relative_to(blocked)
-                return True  # Path is inside blocked directory
-            except ValueError:
-                continue
-        return False
+        resolved = str(path.resolve())
     except (OSError, RuntimeError):
         # Handle resolution errors (e.g., circular symlinks)
         return True
 
+    # Path is a blocked directory or inside one
+    return resolved in _BLOCKED_DIRS or resolved.startswith(_BLOCKED_PREFIXES)
+
 
 def validate_project_path(path: str, dir_type: Literal["scraped", "cards"]) -> Path:
     """Validate and resolve path for project mode browsing.
@@ -68,16 +83,23 @@ def validate_project_path(path: str, dir_type: Literal["scraped", "cards"]) -> P
     if not path or path == ".":
         return base_dir
 
-    # Construct and resolve full path
+    # Absolute paths can never be inside the base directory; reject before resolving
+    if Path(path).is_absolute():
+        raise HTTPException(
+            status_code=403, detail="Access denied: path outside allowed directory"
+        )
+
+    # Construct and resolve full path (resolving also catches symlinks that
+    # point outside the directory, so it can't be skipped for plain paths)
     try:
         full_path = (base_dir / path).resolve()
     except (OSError, RuntimeError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid path: {e}")
 
     # Ensure path is within allowed directory (prevent traversal)
-    try:
-        full_path.relative_to(base_dir)
-    except ValueError:
+    resolved = str(full_path)
+    base = _RESOLVED_PROJECT_DIRS[dir_type]
+    if resolved != base and not resolved.startswith(base + os.sep):
         raise HTTPException(
             status_code=403, detail="Access denied: path outside allowed directory"
         )
@@ -123,31 +145,6 @@ def validate_system_path(path: str) -> Path:
     return path_obj
 
 
-def should_include_file(file_path: Path, mode: str, dir_type: str) -> bool:
-    """Determine if file should be included in listing.
-
-    Args:
-        file_path: Path to file
-        mode: "project" or "system"
-        dir_type: "scraped" or "cards" (only relevant for project mode)
-
-    Returns:
-        True if file should be included
-    """
-    # Skip hidden files
-    if file_path.name.startswith("."):
-        return False
-
-    # In project mode, filter by extension
-    if mode == "project" and file_path.is_file():
-        if dir_type == "scraped" and file_path.suffix != ".md":
-            return False
-        if dir_type == "cards" and file_path.suffix != ".json":
-            return False
-
-    return True
-
-
 @router.get("/browse", response_model=FileBrowserResponse)
 async def browse_files(
     path: str = "",
@@ -176,30 +173,47 @@ async def browse_files(
     if not resolved_path.is_dir():
         raise HTTPException(status_code=400, detail="Path is not a directory")
 
-    # List directory contents
+    # List directory contents; DirEntry caches file type from the directory
+    # read, and stat() results once fetched, so each entry costs at most one stat
     nodes = []
     try:
-        items = list(resolved_path.iterdir())
+        with os.scandir(resolved_path) as it:
+            entries = list(it)
     except PermissionError:
         raise HTTPException(status_code=403, detail="Permission denied")
 
-    # Process each item
-    for item in items:
+    # In project mode, files are filtered by extension
+    allowed_suffixes = PROJECT_SUFFIXES[dir_type] if mode == "project" else None
+
+    # Process each entry
+    for entry in entries:
+        # Skip hidden files
+        if entry.name.startswith("."):
+            continue
+
+        item = Path(entry.path)
         try:
-            # Check if we should include this file/directory
-            if not should_include_file(item, mode, dir_type):
+            is_dir = entry.is_dir()
+            is_file = entry.is_file()
+
+            if (
+                allowed_suffixes is not None
+                and is_file
+                and item.suffix not in allowed_suffixes
+            ):
                 continue
 
-            stat = item.stat()
+            stat = entry.stat()
 
+            # Values come straight from the filesystem, so skip validation
             nodes.append(
-                FileNode(
-                    name=item.name,
+                FileNode.model_construct(
+                    name=entry.name,
                     path=str(item)
                     if mode == "system"
                     else str(item.relative_to(PROJECT_ROOT)),
-                    type="directory" if item.is_dir() else "file",
-                    extension=item.suffix if item.is_file() else None,
+                    type="directory" if is_dir else "file",
+                    extension=item.suffix if is_file else None,
                     size=stat.st_size,
                     modified=datetime.fromtimestamp(stat.st_mtime, tz=UTC),
                     readable=True,
@@ -208,12 +222,12 @@ async def browse_files(
         except (PermissionError, OSError):
             # Mark as unreadable but include in list
             nodes.append(
-                FileNode(
-                    name=item.name,
+                FileNode.model_construct(
+                    name=entry.name,
                     path=str(item)
                     if mode == "system"
                     else str(item.relative_to(PROJECT_ROOT)),
-                    type="directory" if item.is_dir() else "file",
+                    type="directory" if entry.is_dir() else "file",
                     extension=None,
                     size=0,
                     modified=datetime.now(tz=UTC),
@@ -243,6 +257,22 @@ async def browse_files(
     )
 
 
+def _walk_files(base_dir: Path, suffix: str) -> Iterator[tuple[int, Path, int]]:
+    """Yield (mtime_ns, path, size) for visible files under base_dir with suffix."""
+    for root, dirs, files in os.walk(base_dir):
+        # Prune hidden directories in place so os.walk never descends into them
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        for name in files:
+            if name.startswith(".") or not name.endswith(suffix):
+                continue
+            file_path = Path(root, name)
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            yield stat.st_mtime_ns, file_path, stat.st_size
+
+
 @router.get("/recent", response_model=list[FileNode])
 async def get_recent_files(limit: int = 10):
     """Get recently modified files from project directories.
@@ -253,49 +283,27 @@ async def get_recent_files(limit: int = 10):
     Returns:
         List of FileNode objects sorted by modification time (most recent first)
     """
-    all_files = []
-
-    # Collect from scraped/ (*.md files)
-    if SCRAPED_DIR.exists():
-        for f in SCRAPED_DIR.rglob("*.md"):
-            if f.is_file() and not f.name.startswith("."):
-                try:
-                    stat = f.stat()
-                    all_files.append((f, stat.st_mtime))
-                except OSError:
-                    continue
-
-    # Collect from cards/ (*.json files)
-    if CARDS_DIR.exists():
-        for f in CARDS_DIR.rglob("*.json"):
-            if f.is_file() and not f.name.startswith("."):
-                try:
-                    stat = f.stat()
-                    all_files.append((f, stat.st_mtime))
-                except OSError:
-                    continue
-
-    # Sort by modification time (most recent first)
-    all_files.sort(key=lambda x: x[1], reverse=True)
+    # scraped/ (*.md files) and cards/ (*.json files); a missing dir yields nothing
+    candidates = itertools.chain(
+        _walk_files(SCRAPED_DIR, ".md"), _walk_files(CARDS_DIR, ".json")
+    )
+
+    # Keep only the top `limit` instead of sorting every file
+    recent = heapq.nlargest(max(limit, 0), candidates, key=lambda x: x[0])
 
     # Convert to FileNode objects
     nodes = []
-    for file_path, mtime in all_files[:limit]:
-        try:
-            stat = file_path.stat()
-            nodes.append(
-                FileNode(
-                    name=file_path.name,
-                    path=str(file_path.relative_to(PROJECT_ROOT)),
-                    type="file",
-                    extension=file_path.suffix,
-                    size=stat.st_size,
-                    modified=datetime.fromtimestamp(mtime, tz=UTC),
-                    readable=True,
-                )
+    for mtime_ns, file_path, size in recent:
+        nodes.append(
+            FileNode.model_construct(
+                name=file_path.name,
+                path=str(file_path.relative_to(PROJECT_ROOT)),
+                type="file",
+                extension=file_path.suffix,
+                size=size,
+                modified=datetime.fromtimestamp(mtime_ns / 1e9, tz=UTC),
+                readable=True,
             )
-        except OSError:
-            # Skip if file no longer accessible
-            continue
+        )
 
     return nodes
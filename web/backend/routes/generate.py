@@ -2,32 +2,306 @@
 
 import asyncio
 import contextlib
+import itertools
+import logging
+import os
 import re
+import signal
+import stat
+import time
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from pathlib import Path
-from uuid import uuid4
+from weakref import WeakValueDictionary
 
+import orjson
 from claude_agent_sdk import (
     AssistantMessage,
     ClaudeAgentOptions,
+    ClaudeSDKClient,
+    Message,
     TextBlock,
+    ToolResultBlock,
     ToolUseBlock,
-    query,
+    UserMessage,
 )
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from src.youtube import export_transcript_to_markdown, is_youtube_url
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # Project root and output directories
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 CARDS_DIR = PROJECT_ROOT / "cards"
 SCRAPED_DIR = PROJECT_ROOT / "scraped"
 SCRAPE_SCRIPT = PROJECT_ROOT / "scrape.sh"
+# String forms passed to subprocesses, derived once
+_PROJECT_ROOT_STR = str(PROJECT_ROOT)
+_SCRAPE_SCRIPT_STR = str(SCRAPE_SCRIPT)
+
+# Claude Agent SDK configuration; identical for every session (the prompt
+# carries the per-request source and tags), and never mutated by the SDK
+AGENT_OPTIONS = ClaudeAgentOptions(
+    cwd=_PROJECT_ROOT_STR,
+    allowed_tools=["Read", "Write", "Bash", "Glob", "Grep"],
+    permission_mode="acceptEdits",  # Auto-approve file writes to cards/
+    max_turns=20,  # Increase turns for complex generation
+    setting_sources=["project", "user"],  # Load project settings (skills)
+)
+
+# Path to the scraped markdown file in scrape.sh output
+_SCRAPED_FILE_RE = re.compile(r"scraped/([^\s]+\.md)")
+# scrape.sh's "✓ Scraped content saved to: scraped/<name>.md" line
+_SAVED_FILE_RE = re.compile(r"saved to:\s*\S*scraped/(\S+\.md)")
+# Card file reported by the save step, e.g. "Saved to: cards/<name>.json" or
+# "SUCCESS: Saved 12 cards to cards/<name>.json"
+_SAVED_CARDS_RE = re.compile(r"Saved\b.*?\bto:?\s+\S*?cards/([\w\-]+\.json)")
+
+# Max events coalesced into one WebSocket frame
+MAX_BATCH_EVENTS = 64
+
+# Outbound events buffered per session before send_event blocks
+OUT_QUEUE_SIZE = 256
+
+# SDK messages buffered per agent before its response stream pauses
+AGENT_QUEUE_SIZE = 16
+
+# Seconds a single send may take before text events are dropped
+WRITER_LAG_LIMIT = 2.0
+
+# Events sent within this many seconds share one formatted timestamp
+TIMESTAMP_RESOLUTION = 0.005
+
+# Tool input strings longer than this are truncated in the UI preview
+TOOL_INPUT_PREVIEW_CHARS = 256
+
+# Warm spare agents, created on first use and closed in the app lifespan
+AGENT_POOL_SIZE = 1
+
+# Seconds a connected agent waits for its prompt before disconnecting, so an
+# unused spare doesn't keep its CLI process running indefinitely
+AGENT_IDLE_TIMEOUT = 300.0
+
+# Active generation sessions, held weakly so a skipped cleanup cannot leak one
+active_sessions: WeakValueDictionary[str, "GenerationSession"] = WeakValueDictionary()
+# Session ids are only used for logging; PID + counter is unique enough
+_session_ids = itertools.count(1)
+
+
+class AgentWorker:
+    """
+    Drives one SDK client from connect to disconnect inside a single task.
+
+    ClaudeSDKClient binds its connection to the task that called connect(),
+    so disconnecting from any other task fails and leaks the CLI process.
+    The worker task therefore connects, waits for a prompt, streams the
+    response into a queue and disconnects; callers only touch futures.
+    """
+
+    def __init__(self) -> None:
+        # Set once connecting has finished, whether or not it succeeded
+        self._ready = asyncio.Event()
+        self._connected = False
+        self._prompt: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        # Response messages, then None once the stream has ended
+        self._messages: asyncio.Queue[Message | None] = asyncio.Queue(
+            maxsize=AGENT_QUEUE_SIZE
+        )
+        self.error: Exception | None = None
+        self._disconnecting = False
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        client = ClaudeSDKClient(options=AGENT_OPTIONS)
+        try:
+            try:
+                await client.connect()
+                self._connected = True
+                self._ready.set()
+                await asyncio.wait({self._prompt}, timeout=AGENT_IDLE_TIMEOUT)
+                if not self._prompt.done():
+                    raise TimeoutError("Claude agent idle for too long")
+                await client.query(self._prompt.result())
+                async for message in client.receive_response():
+                    # Waits while the session is behind, pausing the SDK stream
+                    await self._messages.put(message)
+            except Exception as e:
+                self.error = e
+            # Skipped when cancelled: close() only cancels once nobody reads
+            await self._messages.put(None)
+        finally:
+            self._ready.set()
+            self._disconnecting = True
+            try:
+                await client.disconnect()
+            except Exception:
+                logger.exception("Error disconnecting Claude agent")
+
+    @property
+    def usable(self) -> bool:
+        """False once the worker has failed or stopped (e.g. idle timeout)."""
+        return self.error is None and not self._task.done()
+
+    async def wait_ready(self) -> None:
+        """Wait until the client is connected, raising if connecting failed."""
+        await self._ready.wait()
+        if not self._connected:
+            raise self.error or RuntimeError("Claude agent stopped before connecting")
+
+    async def responses(self, prompt: str) -> AsyncIterator[Message]:
+        """Send the prompt and yield the agent's response messages."""
+        self._prompt.set_result(prompt)
+        while (message := await self._messages.get()) is not None:
+            yield message
+        if self.error is not None:
+            raise self.error
+
+    async def close(self) -> None:
+        """Stop the worker and wait for its client to disconnect."""
+        # Never interrupt a disconnect already under way
+        if not self._disconnecting:
+            self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+
+class AgentPool:
+    """
+    Keeps pre-connected agents ready so sessions skip agent startup.
+
+    Agents are handed out once and never returned: every generation needs a
+    fresh conversation, so the session closes its agent when done and the
+    pool starts a replacement in the background. Spares are only started
+    once the first session asks for an agent.
+    """
+
+    def __init__(self, size: int = 1) -> None:
+        self.size = size
+        self._spares: list[AgentWorker] = []
+
+    async def acquire(self) -> AgentWorker:
+        """Return a connected agent, preferring a warm spare that still works."""
+        spare = None
+        while self._spares and spare is None:
+            candidate = self._spares.pop(0)
+            if candidate.usable:
+                spare = candidate
+            else:
+                logger.warning("Discarding stopped warm agent: %s", candidate.error)
+                await candidate.close()
+        self._refill()
+
+        if spare is not None:
+            try:
+                await spare.wait_ready()
+                return spare
+            except Exception as e:
+                logger.warning("Warm agent failed to connect, starting another: %s", e)
+                await spare.close()
+
+        agent = AgentWorker()
+        try:
+            await agent.wait_ready()
+        except BaseException:
+            await agent.close()
+            raise
+        return agent
+
+    def _refill(self) -> None:
+        while len(self._spares) < self.size:
+            self._spares.append(AgentWorker())
+
+    async def close(self) -> None:
+        """Stop idle agents, disconnecting their clients."""
+        spares, self._spares = self._spares, []
+        for agent in spares:
+            await agent.close()
 
-# Active generation sessions
-active_sessions: dict[str, "GenerationSession"] = {}
+
+agent_pool = AgentPool(AGENT_POOL_SIZE)
+
+
+def _parse_scraped_filename(output: str) -> str | None:
+    """Return the "scraped/<name>.md" filename reported by scrape.sh, if any."""
+    match = _SAVED_FILE_RE.search(output)
+    if match is None:
+        # Unusual output: fall back to the first path-looking match
+        match = _SCRAPED_FILE_RE.search(output)
+    return match.group(1) if match else None
+
+
+def _most_recent_file(
+    directory: Path, suffix: str, newer_than_ns: int = -1
+) -> Path | None:
+    """
+    Return the most recently modified file in directory with suffix, if any.
+
+    Only files modified after newer_than_ns (an st_mtime_ns) are considered.
+    """
+    best: str | None = None
+    best_mtime = newer_than_ns
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    mtime = entry.stat().st_mtime_ns
+                    if mtime > best_mtime:
+                        best, best_mtime = entry.path, mtime
+    except FileNotFoundError:
+        return None
+    return Path(best) if best is not None else None
+
+
+def _newest_mtime_ns(directory: Path, suffix: str) -> int:
+    """Return the newest st_mtime_ns among files in directory with suffix, or 0."""
+    newest = 0
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    newest = max(newest, entry.stat().st_mtime_ns)
+    except FileNotFoundError:
+        pass
+    return newest
+
+
+def _parse_saved_cards_filename(output: str) -> str | None:
+    """Return the "cards/<name>.json" filename a save step reported, if any."""
+    matches = _SAVED_CARDS_RE.findall(output)
+    return matches[-1] if matches else None
+
+
+def _tool_result_text(block: ToolResultBlock) -> str:
+    """Return the text of a tool result, which may be a string or text parts."""
+    if isinstance(block.content, str):
+        return block.content
+    return "\n".join(
+        part.get("text", "") for part in block.content or () if isinstance(part, dict)
+    )
+
+
+def _similar_files(directory: Path, needle: str, limit: int = 5) -> list[str]:
+    """Return up to limit entry names in directory that contain needle."""
+    names: list[str] = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if needle in entry.name:
+                names.append(entry.name)
+                if len(names) >= limit:
+                    break
+    return names
+
+
+def _preview_tool_input(tool_input: dict) -> dict:
+    """Truncate long string values (e.g. Write file contents) for display."""
+    return {
+        key: value[:TOOL_INPUT_PREVIEW_CHARS] + "…"
+        if isinstance(value, str) and len(value) > TOOL_INPUT_PREVIEW_CHARS
+        else value
+        for key, value in tool_input.items()
+    }
 
 
 class GenerationSession:
@@ -40,18 +314,148 @@ class GenerationSession:
         self.tags: str | None = None
         self.scraped_path: str | None = None
         self.output_file: str | None = None
+        # Newest cards/*.json mtime before the agent ran
+        self._cards_mtime_ns = 0
+        # cards/ filename the agent's save step reported, if any
+        self._reported_cards_file: str | None = None
+        self.agent: AgentWorker | None = None
+        self.out_queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=OUT_QUEUE_SIZE)
+        self.dropped_events = 0
+        self._send_started_at: float | None = None
+        self._writer_task: asyncio.Task | None = None
+        # Set once a send fails; the client is gone
+        self._closed = asyncio.Event()
+        self._timestamp_str = ""
+        # Last queued event if it is an unsent status, for dropping repeats
+        self._pending_status: dict | None = None
+        self._timestamp_at = float("-inf")
 
     async def send_event(self, event_type: str, data: dict):
-        """Send JSON event to WebSocket client."""
+        """Queue JSON event for the WebSocket writer task."""
+        if self._closed.is_set():
+            raise WebSocketDisconnect()
+
+        pending = self._pending_status
+        if event_type == "status" and pending is not None and pending["data"] == data:
+            # Repeat of the unsent status last in the queue: just refresh its time.
+            # Distinct messages for one step (e.g. scrape progress) all get sent
+            pending["timestamp"] = self._timestamp()
+            return
+
+        if event_type == "text" and self._writer_lagging():
+            # Agent narration is the only non-essential event; shed it while the
+            # client can't keep up so tool/status/complete/error still get through
+            self.dropped_events += 1
+            return
+
         message = {
             "type": event_type,
             "data": data,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": self._timestamp(),
         }
+        self._pending_status = message if event_type == "status" else None
+        # Blocks when the queue is full, pausing the SDK stream (backpressure)
+        await self.out_queue.put(message)
+
+    def _writer_lagging(self) -> bool:
+        """True while a WebSocket send has been in flight for too long."""
+        busy_since = self._send_started_at
+        return (
+            busy_since is not None and time.monotonic() - busy_since > WRITER_LAG_LIMIT
+        )
+
+    def _timestamp(self) -> str:
+        """Return an ISO timestamp, reused for events within TIMESTAMP_RESOLUTION."""
+        now = time.monotonic()
+        if now - self._timestamp_at >= TIMESTAMP_RESOLUTION:
+            self._timestamp_str = datetime.now(UTC).isoformat()
+            self._timestamp_at = now
+        return self._timestamp_str
+
+    def start_writer(self):
+        """Start the background task that sends queued events."""
+        self._writer_task = asyncio.create_task(self._writer())
+
+    async def stop_writer(self):
+        """Flush queued events, then stop the writer task."""
+        if self._writer_task is None:
+            return
+        await self.out_queue.join()
+        self._writer_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._writer_task
+
+    async def _writer(self):
+        """Send queued events, coalescing whatever is ready into one frame."""
+        while True:
+            batch = [await self.out_queue.get()]
+            while len(batch) < MAX_BATCH_EVENTS and not self.out_queue.empty():
+                batch.append(self.out_queue.get_nowait())
+            # Anything queued from here on starts a new tail
+            self._pending_status = None
+            if self._closed.is_set():
+                # Keep draining so producers blocked on a full queue wake up
+                for _ in batch:
+                    self.out_queue.task_done()
+                continue
+            self._send_started_at = time.monotonic()
+            try:
+                # Binary frame: the client decodes the UTF-8 JSON itself
+                frame = orjson.dumps({"type": "batch", "events": batch})
+                await self.websocket.send_bytes(frame)
+            except Exception as e:
+                logger.warning("Error sending WebSocket message: %s", e)
+                self._closed.set()
+            finally:
+                self._send_started_at = None
+                for _ in batch:
+                    self.out_queue.task_done()
+
+    async def start_agent(self) -> AgentWorker:
+        """Take a connected agent from the pool for this session."""
+        self.agent = await agent_pool.acquire()
+        return self.agent
+
+    async def close_agent(self):
+        """Stop the session's agent, disconnecting its client."""
+        if self.agent is not None:
+            agent, self.agent = self.agent, None
+            await agent.close()
+
+    async def _stream_scrape_output(
+        self, proc: asyncio.subprocess.Process
+    ) -> tuple[str, str]:
+        """Forward scrape.sh progress lines as status events; return stdout/stderr."""
+        # Both pipes are requested in scrape_url
+        assert proc.stdout is not None and proc.stderr is not None
+        # Drain stderr concurrently so a full pipe can't stall the script
+        stderr_task = asyncio.create_task(proc.stderr.read())
         try:
-            await self.websocket.send_json(message)
-        except Exception as e:
-            print(f"Error sending WebSocket message: {e}")
+            lines = []
+            reported = False
+            async for raw_line in proc.stdout:
+                line = raw_line.decode().rstrip()
+                lines.append(line)
+                # Progress is only interesting until the saved path is reported;
+                # the rest of the output is CLI usage hints
+                if line and not reported:
+                    reported = _SAVED_FILE_RE.search(line) is not None
+                    await self.send_event(
+                        "status", {"message": line, "step": "scraping"}
+                    )
+            stderr = await stderr_task
+            await proc.wait()
+            return "\n".join(lines), stderr.decode()
+        finally:
+            # Timed out, client gone or send failed: don't leave the script running
+            if proc.returncode is None:
+                # Kill the whole group: children like `uv run` hold the pipes open
+                with contextlib.suppress(ProcessLookupError):
+                    os.killpg(proc.pid, signal.SIGKILL)
+                await proc.wait()
+            stderr_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await stderr_task
 
     async def scrape_url(self, url: str) -> str:
         """Scrape URL to markdown using scrape.sh script."""
@@ -62,28 +466,28 @@ class GenerationSession:
             "status", {"message": "Scraping content from URL...", "step": "scraping"}
         )
 
-        # Run scrape script in background thread to avoid blocking
-        def run_scrape():
-            import subprocess
-
-            result = subprocess.run(
-                [str(SCRAPE_SCRIPT), url],
-                cwd=PROJECT_ROOT,
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-            if result.returncode != 0:
-                raise RuntimeError(f"Scraping failed: {result.stderr}")
-            return result.stdout
-
         try:
-            output = await asyncio.to_thread(run_scrape)
+            # Run scrape script as a child process the event loop waits on
+            proc = await asyncio.create_subprocess_exec(
+                _SCRAPE_SCRIPT_STR,
+                url,
+                cwd=_PROJECT_ROOT_STR,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+            )
+            try:
+                output, stderr = await asyncio.wait_for(
+                    self._stream_scrape_output(proc), timeout=60
+                )
+            except TimeoutError:
+                raise RuntimeError("Scraping timed out after 60 seconds")
+            if proc.returncode != 0:
+                raise RuntimeError(f"Scraping failed: {stderr}")
 
             # Extract filename from scrape script output (looks for "scraped/filename.md")
-            match = re.search(r"scraped/([^\s]+\.md)", output)
-            if match:
-                scraped_file = match.group(1)
+            scraped_file = _parse_scraped_filename(output)
+            if scraped_file:
                 scraped_path = SCRAPED_DIR / scraped_file
                 if scraped_path.exists():
                     self.scraped_path = str(scraped_path)
@@ -97,9 +501,8 @@ class GenerationSession:
                     return self.scraped_path
 
             # Fallback: find most recent .md file in scraped/
-            scraped_files = list(SCRAPED_DIR.glob("*.md"))
-            if scraped_files:
-                most_recent = max(scraped_files, key=lambda p: p.stat().st_mtime)
+            most_recent = _most_recent_file(SCRAPED_DIR, ".md")
+            if most_recent is not None:
                 self.scraped_path = str(most_recent)
                 await self.send_event(
                     "status",
@@ -167,19 +570,22 @@ class GenerationSession:
             if not file_path.is_absolute():
                 file_path = PROJECT_ROOT / source
 
-            # Check if file exists
-            if not file_path.exists():
+            # One stat answers both "exists" and "is a regular file"
+            try:
+                st = file_path.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                st = None
+
+            if st is None:
                 # Provide helpful error with suggestions
                 parent_dir = file_path.parent
-                if parent_dir.exists():
-                    similar_files = list(
-                        parent_dir.glob("*" + file_path.stem[:20] + "*")
-                    )
+                if parent_dir.is_dir():
+                    similar_files = _similar_files(parent_dir, file_path.stem[:20])
                     error_msg = f"Source file not found: {file_path}\n"
                     if similar_files:
                         error_msg += f"Similar files in {parent_dir.name}/:\n"
-                        for f in similar_files[:5]:
-                            error_msg += f"  - {f.name}\n"
+                        for name in similar_files:
+                            error_msg += f"  - {name}\n"
                     await self.send_event(
                         "error", {"message": error_msg, "step": "validation"}
                     )
@@ -191,7 +597,7 @@ class GenerationSession:
                     )
                     raise FileNotFoundError(error_msg)
 
-            if not file_path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 error_msg = f"Source is not a file: {file_path}"
                 await self.send_event(
                     "error", {"message": error_msg, "step": "validation"}
@@ -223,19 +629,29 @@ class GenerationSession:
             prompt_parts.extend(["--tags", self.tags])
         prompt = " ".join(prompt_parts)
 
-        # Configure Claude Agent SDK
-        options = ClaudeAgentOptions(
-            cwd=str(PROJECT_ROOT),
-            allowed_tools=["Read", "Write", "Bash", "Glob", "Grep"],
-            permission_mode="acceptEdits",  # Auto-approve file writes to cards/
-            max_turns=20,  # Increase turns for complex generation
-            setting_sources=["project", "user"],  # Load project settings (skills)
+        self._cards_mtime_ns = await asyncio.to_thread(
+            _newest_mtime_ns, CARDS_DIR, ".json"
         )
 
         try:
-            # Stream messages from agent
-            async for message in query(prompt=prompt, options=options):
-                await self.process_sdk_message(message)
+            agent = await self.start_agent()
+
+            # Stream messages from agent, stopping as soon as the client goes away
+            stream = asyncio.create_task(self._stream_agent(agent, prompt))
+            closed = asyncio.create_task(self._closed.wait())
+            try:
+                await asyncio.wait(
+                    {stream, closed}, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                closed.cancel()
+                if not stream.done():
+                    stream.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await stream
+            if self._closed.is_set():
+                raise WebSocketDisconnect()
+            stream.result()
 
             # Find generated output file
             self.output_file = await self.find_output_file()
@@ -257,17 +673,21 @@ class GenerationSession:
                     },
                 )
 
+        except WebSocketDisconnect:
+            raise
         except Exception as e:
-            # Log exception for debugging
-            import traceback
-
-            print(f"Error in card generation: {e}")
-            traceback.print_exc()
+            # Log exception (with traceback) for debugging
+            logger.exception("Error in card generation: %s", e)
             await self.send_event(
                 "error", {"message": f"Generation failed: {e!s}", "step": "generating"}
             )
             raise
 
+    async def _stream_agent(self, agent: AgentWorker, prompt: str):
+        """Send the prompt and forward the agent's response messages."""
+        async for message in agent.responses(prompt):
+            await self.process_sdk_message(message)
+
     async def process_sdk_message(self, message):
         """Process and forward SDK messages to WebSocket client."""
         if isinstance(message, AssistantMessage):
@@ -281,24 +701,31 @@ class GenerationSession:
                         "tool",
                         {
                             "name": block.name,
-                            "input": block.input,
+                            "input": _preview_tool_input(block.input),
                         },
                     )
-        # Other message types (SystemMessage, UserMessage, ResultMessage) are internal
-        # to the SDK conversation flow and don't need to be forwarded to the client
+        elif isinstance(message, UserMessage) and isinstance(message.content, list):
+            # Tool results aren't forwarded, but the save step reports its file
+            for block in message.content:
+                if isinstance(block, ToolResultBlock):
+                    reported = _parse_saved_cards_filename(_tool_result_text(block))
+                    if reported is not None:
+                        self._reported_cards_file = reported
+        # Other message types (SystemMessage, ResultMessage) are internal to the
+        # SDK conversation flow and don't need to be forwarded to the client
 
     async def find_output_file(self) -> str | None:
-        """Find the most recently created file in cards/ directory."""
-        if not CARDS_DIR.exists():
-            return None
-
-        json_files = list(CARDS_DIR.glob("*.json"))
-        if not json_files:
-            return None
-
-        # Return most recent file
-        most_recent = max(json_files, key=lambda p: p.stat().st_mtime)
-        return str(most_recent)
+        """Find the cards/ file this session's agent wrote."""
+        if self._reported_cards_file is not None:
+            reported = CARDS_DIR / self._reported_cards_file
+            if await asyncio.to_thread(reported.is_file):
+                return str(reported)
+
+        # Fallback: newest file written since generation started
+        written = await asyncio.to_thread(
+            _most_recent_file, CARDS_DIR, ".json", self._cards_mtime_ns
+        )
+        return str(written) if written is not None else None
 
 
 @router.websocket("/ws/generate")
@@ -306,9 +733,10 @@ async def websocket_generate(websocket: WebSocket):
     """WebSocket endpoint for real-time card generation."""
     await websocket.accept()
 
-    session_id = str(uuid4())
+    session_id = f"{os.getpid()}-{next(_session_ids)}"
     session = GenerationSession(session_id, websocket)
     active_sessions[session_id] = session
+    session.start_writer()
 
     try:
         # Receive initial request with source and optional tags
@@ -335,13 +763,23 @@ async def websocket_generate(websocket: WebSocket):
         await session.generate_cards(source_path)
 
     except WebSocketDisconnect:
-        print(f"WebSocket disconnected for session {session_id}")
+        logger.info("WebSocket disconnected for session %s", session_id)
     except Exception as e:
-        print(f"Error in generation session {session_id}: {e}")
+        logger.error("Error in generation session %s: %s", session_id, e)
         with contextlib.suppress(Exception):
             await session.send_event("error", {"message": str(e), "step": "unknown"})
     finally:
-        # Cleanup
+        # Cleanup: deliver any queued events before closing
         active_sessions.pop(session_id, None)
+        if session.dropped_events:
+            logger.info(
+                "Dropped %d text events for slow session %s",
+                session.dropped_events,
+                session_id,
+            )
+        with contextlib.suppress(Exception):
+            await session.close_agent()
+        with contextlib.suppress(Exception):
+            await session.stop_writer()
         with contextlib.suppress(Exception):
             await websocket.close()
@@ -1,9 +1,10 @@
 import { useEffect, useRef, useState } from 'react';
 import { useNavigate, useSearchParams } from 'react-router-dom';
-import type { GenerationMessage } from '../types';
+import type { GenerationFrame, GenerationMessage } from '../types';
 import styles from './CardGeneration.module.css';
 
 const WS_URL = 'ws://localhost:8080/api/ws/generate';
+const frameDecoder = new TextDecoder();
 
 export function CardGeneration() {
   const [messages, setMessages] = useState<GenerationMessage[]>([]);
@@ -30,6 +31,8 @@ export function CardGeneration() {
 
     // Connect to WebSocket
     const ws = new WebSocket(WS_URL);
+    // Batch frames arrive as binary UTF-8 JSON; decode them synchronously
+    ws.binaryType = 'arraybuffer';
     wsRef.current = ws;
 
     ws.onopen = () => {
@@ -50,21 +53,26 @@ export function CardGeneration() {
       if (isCleanedUp) return;
 
       try {
-        const message: GenerationMessage = JSON.parse(event.data);
-        setMessages((prev) => [...prev, message]);
-
-        // Handle completion
-        if (message.type === 'complete' && message.data.filename) {
-          setIsComplete(true);
-          // Auto-redirect after 2 seconds
-          setTimeout(() => {
-            navigate(`/review?file=${encodeURIComponent(message.data.filename!)}`);
-          }, 2000);
-        }
-
-        // Handle errors
-        if (message.type === 'error') {
-          setError(message.data.message || 'Unknown error occurred');
+        // The backend coalesces events that are ready together into one batch frame
+        const raw = typeof event.data === 'string' ? event.data : frameDecoder.decode(event.data);
+        const frame: GenerationFrame = JSON.parse(raw);
+        const incoming = frame.type === 'batch' ? frame.events : [frame];
+        setMessages((prev) => [...prev, ...incoming]);
+
+        for (const message of incoming) {
+          // Handle completion
+          if (message.type === 'complete' && message.data.filename) {
+            setIsComplete(true);
+            // Auto-redirect after 2 seconds
+            setTimeout(() => {
+              navigate(`/review?file=${encodeURIComponent(message.data.filename!)}`);
+            }, 2000);
+          }
+
+          // Handle errors
+          if (message.type === 'error') {
+            setError(message.data.message || 'Unknown error occurred');
+          }
         }
       } catch (err) {
         console.error('Failed to parse WebSocket message:', err);
@@ -59,6 +59,13 @@ export interface GenerationMessage {
   timestamp: string;
 }
 
+interface GenerationBatch {
+  type: 'batch';
+  events: GenerationMessage[];
+}
+
+export type GenerationFrame = GenerationMessage | GenerationBatch;
+
 export interface FileNode {
   name: string;
   path: string;